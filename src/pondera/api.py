@@ -1,13 +1,18 @@
 import asyncio
+import atexit
+import sys
+import threading
 import time
+import weakref
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Sequence, TypeVar
 
+from pondera.concurrency import RUNNER_KEY, concurrency_slot, judge_key
 from pondera.judge.protocol import JudgeProtocol
-from pondera.judge import Judge
 from pondera.runner.base import Runner, ProgressCallback, emit_progress
 from pondera.errors import TimeoutError, RunnerError, JudgeError
 from pondera.models.evaluation import EvaluationResult
+from pondera.models.judgment import Judgment
 from pondera.models.rubric import RubricCriterion
 from pondera.models.multi_evaluation import (
     MultiEvaluationResult,
@@ -22,8 +27,41 @@ from pondera.utils import load_case_yaml, apply_prejudge_checks, compute_pass, c
 from pondera.io.artifacts import write_multi_evaluation_artifacts  # type: ignore
 import logging
 
+__all__ = ["evaluate_case", "evaluate_case_async", "evaluate_cases_async"]
+
 log = logging.getLogger("pondera")
 
+# One event loop per thread, reused across sync `evaluate_case` calls so HTTP clients
+# bound to the loop keep their connections alive between cases.
+_LOOPS = threading.local()
+
+
+class _LoopHolder:
+    """Owns one thread's persistent loop; the loop is closed once the thread's locals go."""
+
+    __slots__ = ("loop", "__weakref__")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+
+
+# Holders of loops whose threads are still alive, for the interpreter-exit sweep.
+_HOLDERS: "weakref.WeakSet[_LoopHolder]" = weakref.WeakSet()
+
+T = TypeVar("T")
+
+if sys.version_info >= (3, 11):
+
+    async def _with_timeout(aw: Awaitable[T], timeout: float) -> T:
+        """Await `aw` in the current task; `asyncio.timeout` avoids wait_for's extra Task."""
+        async with asyncio.timeout(timeout):
+            return await aw
+
+else:  # pragma: no cover - Python 3.10
+
+    async def _with_timeout(aw: Awaitable[T], timeout: float) -> T:
+        return await asyncio.wait_for(aw, timeout=timeout)
+
 
 async def _execute_case_once(
     *,
@@ -35,27 +73,35 @@ async def _execute_case_once(
 ) -> EvaluationResult:
     """Internal single execution helper (no YAML reload)."""
     await emit_progress(progress, f"pondera: running case '{case.id}'…")
-    log.debug("case %s: starting runner", case.id)
-    t0 = time.perf_counter()
-    try:
-        run_res = await _run_case(case, runner, progress)
-        t1 = time.perf_counter()
-    except (TimeoutError, RunnerError) as ex:
-        t1 = time.perf_counter()
-        log.warning("case %s: runner failed: %s", case.id, str(ex))
-        run_res = RunResult(
-            question=case.input.query,
-            answer="",
-            error=f"{type(ex).__name__}: {str(ex)}",
-        )
-    failures = apply_prejudge_checks(run_res.answer or "", case)
     use_rubric = choose_rubric(case.judge.rubric, default_rubric)
-    await emit_progress(progress, "pondera: judging answer…")
+    the_judge = judge or _default_judge()
+    prepare_task = _start_judge_prepare(the_judge, use_rubric, case.judge.system_append)
+    try:
+        log.debug("case %s: starting runner", case.id)
+        t0 = time.perf_counter_ns()
+        try:
+            run_res = await _run_case(case, runner, progress)
+            t1 = time.perf_counter_ns()
+        except (TimeoutError, RunnerError) as ex:
+            t1 = time.perf_counter_ns()
+            log.warning("case %s: runner failed: %s", case.id, str(ex))
+            run_res = RunResult(
+                question=case.input.query,
+                answer="",
+                error=f"{type(ex).__name__}: {str(ex)}",
+            )
+        failures = apply_prejudge_checks(run_res.answer or "", case)
+        await emit_progress(progress, "pondera: judging answer…")
+    except BaseException:
+        # Cancelled (e.g. a sibling repetition failed) or the runner raised: don't leave
+        # the prepare task running on the loop with a possibly unretrieved exception.
+        await _cancel_judge_prepare(prepare_task)
+        raise
     log.debug("case %s: starting judge", case.id)
-    t2 = time.perf_counter()
-    the_judge: JudgeProtocol = judge or Judge()
+    t2 = time.perf_counter_ns()
+    await _finish_judge_prepare(case, prepare_task)
     judgment = await _judge_case(case, run_res, the_judge, use_rubric)
-    t3 = time.perf_counter()
+    t3 = time.perf_counter_ns()
     timings = _get_timings(t0, t1, t2, t3)
     passed = _compute_pass(case, failures, judgment)
     log.info(
@@ -68,7 +114,7 @@ async def _execute_case_once(
         timings["judge_s"],
         run_res.error is not None,
     )
-    return EvaluationResult(
+    fields: dict[str, Any] = dict(
         case_id=case.id,
         case=case,
         run=run_res,
@@ -79,6 +125,55 @@ async def _execute_case_once(
         passed=passed,
         timings_s=timings,
     )
+    if (
+        isinstance(run_res, RunResult)
+        and isinstance(judgment, Judgment)
+        and fields["per_criterion_thresholds"].keys() <= judgment.criteria_scores.keys()
+    ):
+        # Parts are already validated models and every threshold key has a score (all that
+        # _validate_threshold_keys checks), so skip re-validation on this per-repetition
+        # path. compute_pass returns early on a failed pre-check or low overall score
+        # without looking at the keys, so a missing one still goes through the validator.
+        return EvaluationResult.model_construct(**fields)
+    return EvaluationResult(**fields)
+
+
+def _default_judge() -> JudgeProtocol:
+    """Build the built-in judge (imported lazily: it pulls in pydantic-ai)."""
+    from pondera.judge.base import Judge
+
+    return Judge()
+
+
+def _start_judge_prepare(
+    judge: JudgeProtocol, rubric: list[RubricCriterion] | None, system_append: str
+) -> "asyncio.Task[None] | None":
+    """Start the judge's optional `prepare` hook so it overlaps with the runner."""
+    prepare = getattr(judge, "prepare", None)
+    if not asyncio.iscoroutinefunction(prepare):
+        return None
+    return asyncio.create_task(prepare(rubric=rubric, system_append=system_append))
+
+
+async def _cancel_judge_prepare(task: "asyncio.Task[None] | None") -> None:
+    """Cancel a pending judge preparation and wait for it, discarding its outcome."""
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except (Exception, asyncio.CancelledError):
+        pass
+
+
+async def _finish_judge_prepare(case: "CaseSpec", task: "asyncio.Task[None] | None") -> None:
+    """Wait for judge preparation; failures are left for `judge()` itself to surface."""
+    if task is None:
+        return
+    try:
+        await task
+    except Exception as ex:
+        log.debug("case %s: judge prepare failed: %s", case.id, ex)
 
 
 async def evaluate_case_async(
@@ -90,20 +185,28 @@ async def evaluate_case_async(
     progress: ProgressCallback | None = None,
     primary_metric: AggregationMetric = AggregationMetric.mean,
     artifacts_root: Path | str | None = None,
+    max_concurrency: int = 8,
 ) -> MultiEvaluationResult:
     """Evaluate a case (any repetitions) and always return a MultiEvaluationResult.
 
     Rationale: a single uniform return type simplifies downstream handling.
     For `repetitions == 1`, the result contains exactly one EvaluationResult in
     `evaluations` and the aggregates are computed over that single sample.
+
+    Repetitions are independent, so they run concurrently (at most
+    `max_concurrency` at a time). Pass `max_concurrency=1` for strictly
+    sequential execution, e.g. when progress output must stay ordered.
     """
-    settings_obj = get_settings()
     if artifacts_root is None:
-        artifacts_root = settings_obj.artifacts_dir
+        artifacts_root = get_settings().artifacts_dir
     case = load_case_yaml(case_yaml_path)
     reps = max(1, getattr(case, "repetitions", 1))
+    if judge is None:
+        # One built-in judge for all repetitions, so its agent and model are built once.
+        judge = _default_judge()
     if reps == 1:
-        # Run exactly once, then wrap in MultiEvaluationResult for a stable API.
+        # Run exactly once, then wrap in MultiEvaluationResult for a stable API. A single
+        # sample needs no statistics pass and its pass/fail is the evaluation's own.
         evaluations = [
             await _execute_case_once(
                 case=case,
@@ -113,12 +216,14 @@ async def evaluate_case_async(
                 progress=progress,
             )
         ]
+        aggregates = CriteriaAggregates.from_singleton(evaluations[0], primary_metric)
+        passed_primary = evaluations[0].passed
     else:
         evaluations = await _run_multiple_evaluations(
-            case, reps, runner, judge, default_rubric, progress
+            case, reps, runner, judge, default_rubric, progress, max_concurrency
         )
-    aggregates, passed_primary = _aggregate_multi_evaluations(evaluations, primary_metric)
-    multi = MultiEvaluationResult(
+        aggregates, passed_primary = _aggregate_multi_evaluations(evaluations, primary_metric)
+    multi = MultiEvaluationResult.model_construct(
         case_id=case.id,
         evaluations=evaluations,
         aggregates=aggregates,
@@ -126,33 +231,77 @@ async def evaluate_case_async(
         primary_metric=primary_metric,
     )
     if artifacts_root:
-        write_multi_evaluation_artifacts(artifacts_root, multi)
+        # Serialization and file writes are blocking; keep them off the event loop so
+        # concurrently evaluated cases keep making progress.
+        await asyncio.to_thread(write_multi_evaluation_artifacts, artifacts_root, multi)
 
-    # Log summary
-    overall_repr = multi.aggregates.overall.model_dump()
-    log.debug(
-        "case %s repetitions=%d primary_metric=%s overall=%s passed=%s",
-        case.id,
-        reps,
-        primary_metric.value,
-        overall_repr,
-        multi.passed,
-    )
+    # Log summary (model_dump only when debug logging is on)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "case %s repetitions=%d primary_metric=%s overall=%s passed=%s",
+            case.id,
+            reps,
+            primary_metric.value,
+            multi.aggregates.overall.model_dump(),
+            multi.passed,
+        )
     return multi
 
 
+async def evaluate_cases_async(
+    case_yaml_paths: Sequence[str | Path],
+    *,
+    runner: Runner,
+    judge: JudgeProtocol | None = None,
+    default_rubric: list[RubricCriterion] | None = None,
+    progress: ProgressCallback | None = None,
+    primary_metric: AggregationMetric = AggregationMetric.mean,
+    artifacts_root: Path | str | None = None,
+    max_concurrency: int = 16,
+    max_repetition_concurrency: int = 8,
+) -> list[MultiEvaluationResult]:
+    """Evaluate several cases concurrently, returning results in input order.
+
+    Each case keeps its runner -> judge dependency, but cases do not wait for
+    each other: at most `max_concurrency` cases are in flight at once, each running
+    at most `max_repetition_concurrency` repetitions at a time (the `max_concurrency`
+    of `evaluate_case_async`). Up to `max_concurrency * max_repetition_concurrency`
+    repetitions can therefore be in flight; the settings-based limits in
+    `pondera.concurrency` still cap concurrent runner and judge calls per provider.
+    """
+    if judge is None and case_yaml_paths:
+        judge = _default_judge()  # shared by every case
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _one(path: str | Path) -> MultiEvaluationResult:
+        async with semaphore:
+            return await evaluate_case_async(
+                path,
+                runner=runner,
+                judge=judge,
+                default_rubric=default_rubric,
+                progress=progress,
+                primary_metric=primary_metric,
+                artifacts_root=artifacts_root,
+                max_concurrency=max_repetition_concurrency,
+            )
+
+    return await _gather_cancelling([_one(p) for p in case_yaml_paths])
+
+
 async def _run_case(case: "CaseSpec", runner: Runner, progress: ProgressCallback | None) -> Any:
     """Run the case using the runner enforcing per-case timeout."""
     try:
-        return await asyncio.wait_for(
-            runner.run(
-                question=case.input.query,
-                attachments=case.input.attachments,
-                params=case.input.params,
-                progress=progress,
-            ),
-            timeout=case.timeout_s,
-        )
+        async with concurrency_slot(RUNNER_KEY):
+            return await _with_timeout(
+                runner.run(
+                    question=case.input.query,
+                    attachments=case.input.attachments,
+                    params=case.input.params,
+                    progress=progress,
+                ),
+                case.timeout_s,
+            )
     except asyncio.TimeoutError as ex:  # pragma: no cover - message path
         raise TimeoutError(f"runner timed out after {case.timeout_s}s for case '{case.id}'") from ex
     except RunnerError:
@@ -166,18 +315,19 @@ async def _judge_case(
 ) -> Any:
     """Judge the answer enforcing per-case timeout."""
     try:
-        return await asyncio.wait_for(
-            judge.judge(
-                question=case.input.query,
-                answer=run_res.answer or "",
-                files=run_res.files,
-                judge_request=case.judge.request,
-                rubric=rubric,
-                system_append=case.judge.system_append,
-                error=getattr(run_res, "error", None),
-            ),
-            timeout=case.timeout_s,
-        )
+        async with concurrency_slot(judge_key()):
+            return await _with_timeout(
+                judge.judge(
+                    question=case.input.query,
+                    answer=run_res.answer or "",
+                    files=run_res.files,
+                    judge_request=case.judge.request,
+                    rubric=rubric,
+                    system_append=case.judge.system_append,
+                    error=getattr(run_res, "error", None),
+                ),
+                case.timeout_s,
+            )
     except asyncio.TimeoutError as ex:  # pragma: no cover - message path
         raise TimeoutError(f"judge timed out after {case.timeout_s}s for case '{case.id}'") from ex
     except JudgeError:
@@ -186,9 +336,9 @@ async def _judge_case(
         raise JudgeError(f"judge raised unexpected exception: {ex}") from ex
 
 
-def _get_timings(t0: float, t1: float, t2: float, t3: float) -> dict[str, float]:
-    """Return timing measurements."""
-    return {"runner_s": t1 - t0, "judge_s": t3 - t2, "total_s": (t3 - t0)}
+def _get_timings(t0: int, t1: int, t2: int, t3: int) -> dict[str, float]:
+    """Return timing measurements in seconds from integer nanosecond readings."""
+    return {"runner_s": (t1 - t0) / 1e9, "judge_s": (t3 - t2) / 1e9, "total_s": (t3 - t0) / 1e9}
 
 
 def _compute_pass(case: "CaseSpec", failures: list[str], judgment: Any) -> bool:
@@ -209,21 +359,44 @@ async def _run_multiple_evaluations(
     judge: JudgeProtocol | None,
     default_rubric: list[RubricCriterion] | None,
     progress: ProgressCallback | None,
+    max_concurrency: int = 8,
 ) -> list[EvaluationResult]:
-    """Run multiple evaluations for repetitions."""
-    evaluations: list[EvaluationResult] = []
-    for i in range(reps):
-        if progress:
-            await progress(f"pondera: repetition {i+1}/{reps} for case '{case.id}'")
-        ev = await _execute_case_once(
-            case=case,
-            runner=runner,
-            judge=judge,
-            default_rubric=default_rubric,
-            progress=progress,
-        )
-        evaluations.append(ev)
-    return evaluations
+    """Run multiple evaluations for repetitions concurrently.
+
+    Results keep repetition order regardless of completion order.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _one(i: int) -> EvaluationResult:
+        async with semaphore:
+            await emit_progress(
+                progress, f"pondera: repetition {i+1}/{reps} for case '{case.id}'"
+            )
+            return await _execute_case_once(
+                case=case,
+                runner=runner,
+                judge=judge,
+                default_rubric=default_rubric,
+                progress=progress,
+            )
+
+    return await _gather_cancelling([_one(i) for i in range(reps)])
+
+
+async def _gather_cancelling(aws: list[Awaitable[T]]) -> list[T]:
+    """`asyncio.gather` that cancels the remaining awaitables as soon as one fails.
+
+    A failed repetition or case fails the whole call, so siblings still waiting on the
+    runner or judge would only burn provider calls whose results are discarded.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 def _aggregate_multi_evaluations(
@@ -231,27 +404,33 @@ def _aggregate_multi_evaluations(
     primary_metric: AggregationMetric,
 ) -> tuple[CriteriaAggregates, bool]:
     """Aggregate results and compute pass/fail for multi-evaluations."""
-    overall_scores = [ev.judgment.score for ev in evaluations]
-    overall_agg = aggregate_numbers([float(s) for s in overall_scores], primary_metric)
-    criteria_keys: set[str] = set()
-    for ev in evaluations:
-        criteria_keys.update(ev.judgment.criteria_scores.keys())
-    per_crit_aggs: dict[str, Any] = {}
-    for key in sorted(criteria_keys):
-        vals = [float(ev.judgment.criteria_scores.get(key, 0)) for ev in evaluations]
-        per_crit_aggs[key] = aggregate_numbers(vals, primary_metric)
-    aggregates = CriteriaAggregates(overall=overall_agg, per_criterion=per_crit_aggs)
-    # Reuse unified compute_pass logic by synthesizing an aggregated score dict.
-    aggregated_criteria_scores: dict[str, int] = {}
-    for k, agg in per_crit_aggs.items():
-        aggregated_criteria_scores[k] = int(getattr(agg, primary_metric.value))
-    overall_value_for_pass = getattr(overall_agg, primary_metric.value)
+    overall_scores: list[float] = []
+    # One pass collecting a column per criterion; a criterion missing from a run counts as 0.
+    buckets: dict[str, list[float]] = {}
     # Aggregate any pre-check failures across runs (if any run failed a pre-check we fail overall).
     aggregated_precheck_failures: list[str] = []
     for idx, ev in enumerate(evaluations):
+        overall_scores.append(float(ev.judgment.score))
+        for k, v in ev.judgment.criteria_scores.items():
+            col = buckets.get(k)
+            if col is None:
+                col = buckets[k] = [0.0] * idx
+            col.append(float(v))
+        for col in buckets.values():
+            if len(col) == idx:
+                col.append(0.0)
         if ev.precheck_failures:
             # Prefix with run index for traceability.
             aggregated_precheck_failures.extend([f"run {idx+1}: {m}" for m in ev.precheck_failures])
+    overall_agg = aggregate_numbers(overall_scores, primary_metric)
+    per_crit_aggs = {k: aggregate_numbers(buckets[k], primary_metric) for k in sorted(buckets)}
+    aggregates = CriteriaAggregates.model_construct(
+        overall=overall_agg, per_criterion=per_crit_aggs
+    )
+    # Reuse unified compute_pass logic by synthesizing an aggregated score dict.
+    metric = primary_metric.value
+    aggregated_criteria_scores = {k: int(getattr(agg, metric)) for k, agg in per_crit_aggs.items()}
+    overall_value_for_pass = getattr(overall_agg, metric)
     passed_primary = compute_pass(
         precheck_failures=aggregated_precheck_failures,
         overall_threshold=evaluations[0].overall_threshold,
@@ -271,6 +450,7 @@ def evaluate_case(
     progress: ProgressCallback | None = None,
     primary_metric: AggregationMetric = AggregationMetric.mean,
     artifacts_root: Path | str | None = None,
+    max_concurrency: int = 8,
 ) -> MultiEvaluationResult:
     """Synchronous wrapper returning a MultiEvaluationResult (see async docstring)."""
     try:
@@ -281,14 +461,69 @@ def evaluate_case(
         raise RuntimeError(
             "An asyncio event loop is running. Use `await evaluate_case_async(...)` in async contexts."
         )
-    return asyncio.run(
-        evaluate_case_async(
-            case_yaml_path,
-            runner=runner,
-            judge=judge,
-            default_rubric=default_rubric,
-            progress=progress,
-            primary_metric=primary_metric,
-            artifacts_root=artifacts_root,
+    persistent = _get_persistent_loop()
+    try:
+        return persistent.run_until_complete(
+            evaluate_case_async(
+                case_yaml_path,
+                runner=runner,
+                judge=judge,
+                default_rubric=default_rubric,
+                progress=progress,
+                primary_metric=primary_metric,
+                artifacts_root=artifacts_root,
+                max_concurrency=max_concurrency,
+            )
         )
-    )
+    except BaseException:
+        # An interrupt (e.g. Ctrl-C) stops the loop with the evaluation's tasks still
+        # pending; drain them as asyncio.run would, so the next call starts on a clean loop.
+        _cancel_all_tasks(persistent)
+        raise
+
+
+def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel every pending task on `loop` and run it until they have all finished."""
+    pending = asyncio.all_tasks(loop)
+    if not pending:
+        return
+    for task in pending:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+
+def _get_persistent_loop() -> asyncio.AbstractEventLoop:
+    """Return this thread's reusable event loop, creating it on first use."""
+    holder: _LoopHolder | None = getattr(_LOOPS, "holder", None)
+    if holder is None or holder.loop.is_closed():
+        holder = _LOOPS.holder = _LoopHolder(_new_event_loop())
+        _HOLDERS.add(holder)
+        # When the thread ends its locals (and the holder) are dropped: close the loop so
+        # its selector and self-pipe fds are released. Exit is handled by the sweep below.
+        weakref.finalize(holder, _close_loop, holder.loop).atexit = False
+    return holder.loop
+
+
+def _close_loop(loop: asyncio.AbstractEventLoop) -> None:
+    if not loop.is_closed() and not loop.is_running():
+        loop.close()
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Use uvloop's faster event loop when it is installed, else asyncio's default."""
+    try:
+        import uvloop  # type: ignore[import-not-found,unused-ignore]
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()  # type: ignore[no-any-return,unused-ignore]
+
+
+@atexit.register
+def _close_persistent_loops() -> None:
+    """Shut down async generators and close every live persistent loop at interpreter exit."""
+    for holder in list(_HOLDERS):
+        loop = holder.loop
+        if not loop.is_closed() and not loop.is_running():
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+    _HOLDERS.clear()
@@ -0,0 +1,53 @@
+"""Process-wide concurrency limits for runner and judge calls.
+
+Repetitions and batch evaluation fan out many calls at once; bounding how many
+are in flight per provider keeps throughput just under the provider's rate limit
+instead of degrading into 429 retries and backoff.
+
+Limits come from settings: ``PONDERA_MAX_CONCURRENCY`` applies to every key and
+``PONDERA_PROVIDER_MAX_CONCURRENCY`` (JSON, e.g. ``{"openai": 32, "runner": 4}``)
+overrides it per key. Limits must be at least 1; without any limit configured the
+slots are no-ops.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from pondera.settings import get_settings
+
+RUNNER_KEY = "runner"
+JUDGE_KEY = "judge"
+
+# Semaphores are bound to the loop they are first used on, so keep one set per loop.
+_SEMAPHORES: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, tuple[int, asyncio.Semaphore]]
+] = weakref.WeakKeyDictionary()
+
+
+def _limit_for(key: str) -> int | None:
+    settings = get_settings()
+    return settings.provider_max_concurrency.get(key, settings.max_concurrency)
+
+
+@asynccontextmanager
+async def concurrency_slot(key: str) -> AsyncIterator[None]:
+    """Hold one slot of the limit configured for `key` while the body runs."""
+    limit = _limit_for(key)
+    if limit is None:
+        yield
+        return
+    per_loop = _SEMAPHORES.setdefault(asyncio.get_running_loop(), {})
+    entry = per_loop.get(key)
+    if entry is None or entry[0] != limit:
+        entry = per_loop[key] = (limit, asyncio.Semaphore(limit))
+    async with entry[1]:
+        yield
+
+
+def judge_key() -> str:
+    """Limiter key for judge calls: the configured model family, if any."""
+    return get_settings().model_family or JUDGE_KEY
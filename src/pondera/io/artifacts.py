@@ -1,21 +1,39 @@
 from __future__ import annotations
 
-import json
 import re
 from pathlib import Path
+from typing import Any
 import logging
 
+from pydantic_core import to_json
+
 from pondera.models.evaluation import EvaluationResult
 from pondera.models.multi_evaluation import MultiEvaluationResult
 
+_log = logging.getLogger("pondera.artifacts")
+
+
+_SLUG_RE = re.compile(r"[^\w\-]+")
+_DASH_RE = re.compile(r"-{2,}")
+
 
 def _slug(s: str) -> str:
     s = s.strip().lower()
-    s = re.sub(r"[^\w\-]+", "-", s)
-    s = re.sub(r"-{2,}", "-", s).strip("-")
+    s = _SLUG_RE.sub("-", s)
+    s = _DASH_RE.sub("-", s).strip("-")
     return s or "case"
 
 
+def _write_text(path: Path, text: str) -> None:
+    """Write `text` as UTF-8 in one buffered write, bypassing the text-mode I/O layer."""
+    path.write_bytes(text.encode("utf-8"))
+
+
+def _write_json(path: Path, obj: Any) -> None:
+    """Write `obj` as indented UTF-8 JSON, serialized straight to bytes by pydantic-core."""
+    path.write_bytes(to_json(obj, indent=2))
+
+
 def _summary_md(res: EvaluationResult) -> str:
     j = res.judgment
     lines: list[str] = []
@@ -62,23 +80,24 @@ def write_case_artifacts(artifacts_root: Path | str, res: EvaluationResult) -> P
       - summary.md
     Returns the case directory path.
     """
-    root = Path(artifacts_root)
-    case_dir = root / _slug(res.case_id)
+    case_dir = Path(artifacts_root) / _slug(res.case_id)
     case_dir.mkdir(parents=True, exist_ok=True)
+    _write_case_files(case_dir, res)
+    return case_dir
+
 
+def _write_case_files(case_dir: Path, res: EvaluationResult) -> None:
+    """Write the per-case artifact files into an existing `case_dir`."""
     # answer.md
-    (case_dir / "answer.md").write_text(res.run.answer or "", encoding="utf-8")
+    _write_text(case_dir / "answer.md", res.run.answer or "")
 
     # judgment.json
-    (case_dir / "judgment.json").write_text(
-        json.dumps(res.judgment.model_dump(), indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    _write_json(case_dir / "judgment.json", res.judgment)
 
     # judge_prompt.txt (if available)
     prompt_text = getattr(res.judgment, "judge_prompt", "") or ""
     if prompt_text:
-        (case_dir / "judge_prompt.txt").write_text(prompt_text, encoding="utf-8")
+        _write_text(case_dir / "judge_prompt.txt", prompt_text)
 
     # meta.json
     meta = {
@@ -93,16 +112,12 @@ def write_case_artifacts(artifacts_root: Path | str, res: EvaluationResult) -> P
         "files": res.run.files,
         "has_judge_prompt": bool(prompt_text),
     }
-    (case_dir / "meta.json").write_text(
-        json.dumps(meta, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    _write_json(case_dir / "meta.json", meta)
 
     # summary.md (human friendly) + log to stdout via logger
     summary_text = _summary_md(res)
-    (case_dir / "summary.md").write_text(summary_text, encoding="utf-8")
-    logging.getLogger("pondera.artifacts").info("\n" + summary_text.rstrip())
-
-    return case_dir
+    _write_text(case_dir / "summary.md", summary_text)
+    _log.info("\n%s", summary_text.rstrip())
 
 
 def write_multi_evaluation_artifacts(
@@ -116,26 +131,27 @@ def write_multi_evaluation_artifacts(
         aggregates.json          (raw aggregates + pass + primary metric)
         evaluations/<idx>/...    (each repetition, reuse write_case_artifacts)
     """
-    root = Path(artifacts_root)
-    base = root / _slug(res.case_id) / "multi"
+    slug = _slug(res.case_id)
+    base = Path(artifacts_root) / slug / "multi"
     evals_dir = base / "evaluations"
     evals_dir.mkdir(parents=True, exist_ok=True)
 
-    # Per evaluation artifacts (numbered for reproducibility, preserve order)
+    # Per evaluation artifacts (numbered for reproducibility, preserve order). Every
+    # repetition shares the case id, so the slug is computed once for all of them.
     for idx, ev in enumerate(res.evaluations, start=1):
-        write_case_artifacts(evals_dir / f"{idx:03d}", ev)
+        case_dir = evals_dir / f"{idx:03d}" / slug
+        case_dir.mkdir(parents=True, exist_ok=True)
+        _write_case_files(case_dir, ev)
 
     # Aggregates json
     aggregates_payload = {
         "case_id": res.case_id,
         "passed": res.passed,
         "primary_metric": res.primary_metric.value,
-        "overall": res.aggregates.overall.model_dump(),
-        "per_criterion": {k: v.model_dump() for k, v in res.aggregates.per_criterion.items()},
+        "overall": res.aggregates.overall,
+        "per_criterion": res.aggregates.per_criterion,
     }
-    (base / "aggregates.json").write_text(
-        json.dumps(aggregates_payload, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    _write_json(base / "aggregates.json", aggregates_payload)
 
     # Human summary
     lines: list[str] = []
@@ -155,7 +171,7 @@ def write_multi_evaluation_artifacts(
                 f"- **{k}**: min={agg.min}, max={agg.max}, mean={agg.mean}, median={agg.median}, stdev={agg.stdev}, variance={agg.variance}"
             )
     multi_summary = "\n".join(lines) + "\n"
-    (base / "summary.md").write_text(multi_summary, encoding="utf-8")
-    logging.getLogger("pondera.artifacts").info("\n" + multi_summary.rstrip())
+    _write_text(base / "summary.md", multi_summary)
+    _log.info("\n%s", multi_summary.rstrip())
 
     return base
@@ -1,4 +1,20 @@
-from .base import Judge, JudgeError  # noqa: F401
+from typing import TYPE_CHECKING, Any
+
+from pondera.errors import JudgeError  # noqa: F401
+from .cached import CachedJudge  # noqa: F401
 from .protocol import JudgeProtocol  # noqa: F401
 
-__all__ = ["Judge", "JudgeError", "JudgeProtocol"]
+if TYPE_CHECKING:
+    from .base import Judge  # noqa: F401
+
+__all__ = ["CachedJudge", "Judge", "JudgeError", "JudgeProtocol"]
+
+
+def __getattr__(name: str) -> Any:
+    # The built-in Judge pulls in pydantic-ai; import it on first use so custom judges
+    # (and anything importing only the protocol) don't pay for it.
+    if name == "Judge":
+        from .base import Judge
+
+        return Judge
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,12 @@
 # src/pondera/judge/base.py
+import asyncio
+import stat
+import threading
 from pathlib import Path
 from typing import Any
 
+from pydantic_ai import Agent
+
 from pondera.models.rubric import RubricCriterion
 from pondera.models.judgment import Judgment
 from pondera.utils import rubric_to_markdown, rubric_weight_note, default_rubric
@@ -10,6 +15,35 @@ from pondera.judge.protocol import JudgeProtocol
 from pondera.errors import JudgeError
 
 
+MAX_FILES = 5
+MAX_BYTES_PER_FILE = 20_000  # 20 KB per file
+
+
+def _read_file_snippet(p: str) -> str:
+    """Render one generated file for the judge prompt (blocking; run in a thread)."""
+    try:
+        fp = Path(p)
+        try:
+            st = fp.stat()  # one syscall for existence, type and size
+        except FileNotFoundError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
+            return f"--- {p} (missing) ---"
+        size = st.st_size
+        if size > MAX_BYTES_PER_FILE:
+            return f"--- {p} (skipped: {size} bytes > {MAX_BYTES_PER_FILE}) ---"
+        with fp.open("rb") as fh:
+            # Bounded even if the file grew after the stat above.
+            raw = fh.read(MAX_BYTES_PER_FILE)
+        if b"\x00" in raw:
+            return f"--- {p} (skipped: binary) ---"
+        text = raw.decode("utf-8", errors="replace")
+        snippet = text[:MAX_BYTES_PER_FILE]
+        return f"--- {p} ({len(snippet)} bytes) ---\n{snippet}".rstrip()
+    except Exception as e:  # pragma: no cover
+        return f"--- {p} (error reading: {e}) ---"
+
+
 class Judge(JudgeProtocol):
     """LLM-as-a-Judge returning a strict `Judgment`."""
 
@@ -25,6 +59,19 @@ class Judge(JudgeProtocol):
         self._system_append = system_append
         self._model = model
         self._tools = tools
+        # Agents keyed on (rubric criteria, per-case system_append), so repeated calls
+        # skip both system prompt rendering and agent construction.
+        self._agents: dict[tuple[tuple[tuple[str, float, str], ...], str], Agent] = {}
+        # Concurrent repetitions prepare the same agent from worker threads; build each once.
+        self._agents_lock = threading.Lock()
+
+    async def prepare(
+        self, *, rubric: list[RubricCriterion] | None = None, system_append: str = ""
+    ) -> None:
+        """Build the judge agent ahead of time, e.g. while the runner is still working."""
+        rb = rubric or self._default_rubric
+        if rb:
+            await asyncio.to_thread(self._agent_for, rb, system_append)
 
     async def judge(
         self,
@@ -41,37 +88,14 @@ class Judge(JudgeProtocol):
         if not rb:
             raise JudgeError("No rubric provided or configured.")
 
-        use_system = self._system_prompt(
-            rb, self._system_append + ("\n" + system_append if system_append else "")
-        )
-        agent = get_agent(system_prompt=use_system, output_type=Judgment, tools=self._tools)
+        agent = self._agent_for(rb, system_append)
 
         files_section = "\n".join(f"- {p}" for p in (files or [])) or "(none)"
 
-        inline_snippets: list[str] = []
-        MAX_FILES = 5
-        MAX_BYTES_PER_FILE = 20_000  # 20 KB per file
-        for p in (files or [])[:MAX_FILES]:
-            try:
-                fp = Path(p)
-                if not fp.exists() or not fp.is_file():
-                    inline_snippets.append(f"--- {p} (missing) ---")
-                    continue
-                size = fp.stat().st_size
-                if size > MAX_BYTES_PER_FILE:
-                    inline_snippets.append(
-                        f"--- {p} (skipped: {size} bytes > {MAX_BYTES_PER_FILE}) ---"
-                    )
-                    continue
-                raw = fp.read_bytes()
-                if b"\x00" in raw:
-                    inline_snippets.append(f"--- {p} (skipped: binary) ---")
-                    continue
-                text = raw.decode("utf-8", errors="replace")
-                snippet = text[:MAX_BYTES_PER_FILE]
-                inline_snippets.append(f"--- {p} ({len(snippet)} bytes) ---\n{snippet}".rstrip())
-            except Exception as e:  # pragma: no cover
-                inline_snippets.append(f"--- {p} (error reading: {e}) ---")
+        # Read the inlined files concurrently in worker threads, off the event loop.
+        inline_snippets: list[str] = await asyncio.gather(
+            *(asyncio.to_thread(_read_file_snippet, p) for p in (files or [])[:MAX_FILES])
+        )
 
         files_content_block = (
             "\n\nFile contents (truncated/limited):\n" + "\n\n".join(inline_snippets)
@@ -95,13 +119,28 @@ class Judge(JudgeProtocol):
             {judge_request}
         """.strip()
 
-        result, _nodes = await run_agent(agent, user_prompt)
+        result, _nodes = await run_agent(agent, user_prompt, collect_nodes=False)
         try:
             result.judge_prompt = user_prompt
         except Exception:  # pragma: no cover
             pass
         return result
 
+    def _agent_for(self, rubric: list[RubricCriterion], system_append: str) -> Agent:
+        key = (tuple((c.name, c.weight, c.description) for c in rubric), system_append)
+        agent = self._agents.get(key)
+        if agent is not None:
+            return agent
+        with self._agents_lock:
+            agent = self._agents.get(key)
+            if agent is None:
+                use_system = self._system_prompt(
+                    rubric, self._system_append + ("\n" + system_append if system_append else "")
+                )
+                agent = get_agent(system_prompt=use_system, output_type=Judgment, tools=self._tools)
+                self._agents[key] = agent
+        return agent
+
     def _system_prompt(self, rubric: list[RubricCriterion], extra: str) -> str:
         rubric_md = rubric_to_markdown(rubric)
         return f"""
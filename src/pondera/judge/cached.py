@@ -0,0 +1,204 @@
+# src/pondera/judge/cached.py
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+from collections import OrderedDict
+from contextlib import closing
+from pathlib import Path
+
+from pondera.models.judgment import Judgment
+from pondera.models.rubric import RubricCriterion
+from pondera.judge.protocol import JudgeProtocol
+
+
+class _OwnerCancelled(Exception):
+    """Set on a pending judgment whose owning call was cancelled before finishing."""
+
+
+class CachedJudge(JudgeProtocol):
+    """Exact-match cache in front of another judge.
+
+    Identical judge inputs (question, answer, files, request, rubric, system_append, error)
+    are judged once; later calls, including concurrent repetitions, reuse that `Judgment`.
+    Files are keyed on their path plus modification time and size, since the judge reads
+    their contents: a runner rewriting the same path gets a fresh judgment.
+    Only worth it for deterministic judges (temperature 0), so it is opt-in:
+    ``evaluate_case(..., judge=CachedJudge(Judge()))``. Share one instance across cases to
+    share the cache.
+
+    With `path`, judgments are also persisted to a SQLite file and reused across runs; set
+    `namespace` (e.g. the judge model name) so a different judge does not hit stale entries.
+    Persisted entries key files on a digest of their contents instead of mtime and size.
+    """
+
+    def __init__(
+        self,
+        judge: JudgeProtocol,
+        *,
+        maxsize: int = 1024,
+        path: str | Path | None = None,
+        namespace: str = "",
+    ) -> None:
+        self._judge = judge
+        self._maxsize = maxsize
+        self._path = Path(path) if path is not None else None
+        self._namespace = namespace
+        # Judgments are kept as JSON: re-hydrating with model_validate_json (jiter) is
+        # cheaper than model_copy(deep=True) and hands every caller an independent object.
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._pending: dict[str, asyncio.Future[str]] = {}
+
+    async def prepare(
+        self, *, rubric: list[RubricCriterion] | None = None, system_append: str = ""
+    ) -> None:
+        """Forward the optional `prepare` hook to the wrapped judge."""
+        prepare = getattr(self._judge, "prepare", None)
+        if asyncio.iscoroutinefunction(prepare):
+            await prepare(rubric=rubric, system_append=system_append)
+
+    async def judge(
+        self,
+        *,
+        question: str,
+        answer: str,
+        files: list[str] | None,
+        judge_request: str,
+        rubric: list[RubricCriterion] | None = None,
+        system_append: str = "",
+        error: str | None = None,
+    ) -> Judgment:
+        key = _cache_key(
+            namespace=self._namespace,
+            question=question,
+            answer=answer,
+            files=await self._files_key(files) if files else [],
+            judge_request=judge_request,
+            rubric=[(c.name, c.weight, c.description) for c in rubric] if rubric else None,
+            system_append=system_append,
+            error=error,
+        )
+        while True:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return Judgment.model_validate_json(self._cache[key])
+            pending = self._pending.get(key)
+            if pending is None:
+                break
+            try:
+                return Judgment.model_validate_json(await asyncio.shield(pending))
+            except _OwnerCancelled:
+                # The call we joined was cancelled, not failed: retry, and the first waiter
+                # back becomes the new owner.
+                continue
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            raw = await self._load(key)
+            if raw is None:
+                judgment = await self._judge.judge(
+                    question=question,
+                    answer=answer,
+                    files=files,
+                    judge_request=judge_request,
+                    rubric=rubric,
+                    system_append=system_append,
+                    error=error,
+                )
+                raw = judgment.model_dump_json()
+                await self._store(key, raw)
+        except Exception as e:
+            # Concurrent callers with the same inputs share the failure, as they would the result.
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody is waiting
+            raise
+        except BaseException:
+            # Only the owner was cancelled (e.g. by its timeout); waiters must not inherit it.
+            future.set_exception(_OwnerCancelled())
+            future.exception()
+            raise
+        finally:
+            del self._pending[key]
+        future.set_result(raw)
+        self._cache[key] = raw
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+        return Judgment.model_validate_json(raw)
+
+    def cache_clear(self) -> None:
+        """Drop every in-memory cached judgment (the on-disk store is left untouched)."""
+        self._cache.clear()
+
+    async def _files_key(self, files: list[str]) -> list[tuple[object, ...]]:
+        # Persisted entries outlive the files' mtimes (the next run regenerates them, and
+        # copies or extracted archives can keep old ones), so key those on the contents.
+        states = _file_digests if self._path is not None else _file_states
+        return await asyncio.to_thread(states, files)
+
+    async def _load(self, key: str) -> str | None:
+        if self._path is None:
+            return None
+        return await asyncio.to_thread(_db_get, self._path, key)
+
+    async def _store(self, key: str, raw: str) -> None:
+        if self._path is not None:
+            await asyncio.to_thread(_db_put, self._path, key, raw)
+
+
+def _cache_key(**parts: object) -> str:
+    payload = json.dumps(parts, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _file_states(files: list[str]) -> list[tuple[object, ...]]:
+    """Each path with its (mtime_ns, size), or just the path when it cannot be stat'ed."""
+    states: list[tuple[object, ...]] = []
+    for f in files:
+        try:
+            st = os.stat(f)
+        except OSError:
+            states.append((f,))
+        else:
+            states.append((f, st.st_mtime_ns, st.st_size))
+    return states
+
+
+def _file_digests(files: list[str]) -> list[tuple[object, ...]]:
+    """Each path with a digest of its contents, or just the path when it cannot be read."""
+    digests: list[tuple[object, ...]] = []
+    for f in files:
+        h = hashlib.blake2b(digest_size=16)
+        try:
+            with open(f, "rb") as fh:
+                for chunk in iter(lambda: fh.read(1 << 16), b""):
+                    h.update(chunk)
+        except OSError:
+            digests.append((f,))
+        else:
+            digests.append((f, h.hexdigest()))
+    return digests
+
+
+def _db_connect(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE IF NOT EXISTS judgments (key TEXT PRIMARY KEY, judgment TEXT)")
+    return conn
+
+
+def _db_get(path: Path, key: str) -> str | None:
+    if not path.exists():
+        return None
+    with closing(_db_connect(path)) as conn:
+        row = conn.execute("SELECT judgment FROM judgments WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def _db_put(path: Path, key: str, judgment_json: str) -> None:
+    with closing(_db_connect(path)) as conn, conn:
+        conn.execute("INSERT OR REPLACE INTO judgments VALUES (?, ?)", (key, judgment_json))
+
+
+__all__ = ["CachedJudge"]
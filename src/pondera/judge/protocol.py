@@ -16,6 +16,11 @@ class JudgeProtocol(Protocol):
     Custom judges must implement a single async method `judge` with the
     same signature as the built-in judge class and return a `Judgment`.
     Implementations may ignore parameters they don't need (e.g. `files`).
+
+    Judges may additionally define an optional coroutine
+    ``prepare(*, rubric, system_append)``; when present it is started
+    concurrently with the runner so setup work (prompt/agent construction)
+    overlaps with runner latency.
     """
 
     async def judge(  # noqa: D401 - concise, signature is self-documenting
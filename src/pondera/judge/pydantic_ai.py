@@ -2,8 +2,10 @@
 Core agent implementation providing model selection and configuration for AI agents.
 """
 
+import threading
+from functools import lru_cache
 from types import NoneType
-from typing import Any
+from typing import Any, TypeVar, cast
 
 from openai import AsyncAzureOpenAI
 from pydantic_ai import Agent
@@ -18,6 +20,18 @@ from pydantic_ai.usage import UsageLimits
 
 from pondera.settings import get_settings
 
+T = TypeVar("T")
+
+
+def _require(value: T | None, message: str) -> T:
+    """Return `value`, raising `ValueError(message)` when a required setting is empty.
+
+    Explicit rather than `assert`, so the check survives `python -O`.
+    """
+    if not value:
+        raise ValueError(message)
+    return value
+
 
 def _get_model_anthropic(
     model_name: str | None = None, anthropic_api_key: str | None = None
@@ -27,8 +41,8 @@ def _get_model_anthropic(
     anthropic_api_key = anthropic_api_key or settings.anthropic_api_key
     model_name = model_name or "claude-3-5-sonnet-20241022"  # Default Anthropic model
 
-    assert anthropic_api_key, "ANTHROPIC_API_KEY is not set"
-    assert model_name, "Model name is not set"
+    anthropic_api_key = _require(anthropic_api_key, "ANTHROPIC_API_KEY is not set")
+    model_name = _require(model_name, "Model name is not set")
 
     provider = AnthropicProvider(api_key=anthropic_api_key)
     return AnthropicModel(model_name=model_name, provider=provider)
@@ -42,8 +56,8 @@ def _get_model_bedrock(
     model_name = model_name or settings.bedrock_model_name
     aws_region = aws_region or settings.aws_region
 
-    assert model_name, "BEDROCK_MODEL_NAME is not set"
-    assert aws_region, "AWS_REGION is not set"
+    model_name = _require(model_name, "BEDROCK_MODEL_NAME is not set")
+    aws_region = _require(aws_region, "AWS_REGION is not set")
 
     if settings.aws_profile is not None:
         return BedrockConverseModel(model_name=model_name)
@@ -60,8 +74,8 @@ def _get_model_ollama(
     ollama_url = ollama_url or settings.ollama_url
     model_name = model_name or settings.ollama_model_name
 
-    assert ollama_url, "OLLAMA_URL is not set"
-    assert model_name, "Model name is not set"
+    ollama_url = _require(ollama_url, "OLLAMA_URL is not set")
+    model_name = _require(model_name, "Model name is not set")
 
     provider = OpenAIProvider(base_url=ollama_url)
     return OpenAIChatModel(model_name=model_name, provider=provider)
@@ -75,8 +89,8 @@ def _get_model_openai(
     openai_api_key = openai_api_key or settings.openai_api_key
     model_name = model_name or settings.openai_model_name
 
-    assert openai_api_key, "OPENAI_API_KEY is not set"
-    assert model_name, "Model name is not set"
+    openai_api_key = _require(openai_api_key, "OPENAI_API_KEY is not set")
+    model_name = _require(model_name, "Model name is not set")
 
     provider = OpenAIProvider(api_key=openai_api_key)
     return OpenAIChatModel(model_name=model_name, provider=provider)
@@ -95,19 +109,29 @@ def _get_model_openai_azure(
     azure_openai_endpoint = azure_openai_endpoint or settings.azure_openai_endpoint
     azure_openai_api_version = azure_openai_api_version or settings.azure_openai_api_version
 
-    assert azure_openai_endpoint, "AZURE_OPENAI_ENDPOINT is not set"
-    assert azure_openai_api_key, "AZURE_OPENAI_API_KEY is not set"
-    assert azure_openai_api_version, "AZURE_OPENAI_API_VERSION is not set"
-    assert model_name, "Model name is not set"
+    azure_openai_endpoint = _require(azure_openai_endpoint, "AZURE_OPENAI_ENDPOINT is not set")
+    azure_openai_api_key = _require(azure_openai_api_key, "AZURE_OPENAI_API_KEY is not set")
+    azure_openai_api_version = _require(
+        azure_openai_api_version, "AZURE_OPENAI_API_VERSION is not set"
+    )
+    model_name = _require(model_name, "Model name is not set")
 
-    client = AsyncAzureOpenAI(
-        azure_endpoint=azure_openai_endpoint,
-        api_version=azure_openai_api_version,
-        api_key=azure_openai_api_key,
+    client = _azure_openai_client(
+        azure_openai_endpoint, azure_openai_api_version, azure_openai_api_key
     )
     return OpenAIChatModel(model_name=model_name, provider=OpenAIProvider(openai_client=client))
 
 
+@lru_cache(maxsize=8)
+def _azure_openai_client(endpoint: str, api_version: str, api_key: str) -> AsyncAzureOpenAI:
+    """One Azure client (and HTTP connection pool) per endpoint, shared across judge calls.
+
+    The other providers already reuse pydantic-ai's cached HTTP client; without this each
+    Azure model got a fresh client and paid a new TLS handshake per evaluation.
+    """
+    return AsyncAzureOpenAI(azure_endpoint=endpoint, api_version=api_version, api_key=api_key)
+
+
 def _get_model_open_router(
     model_name: str | None = None,
     openrouter_api_url: str | None = None,
@@ -119,27 +143,48 @@ def _get_model_open_router(
     openrouter_api_url = openrouter_api_url or settings.openrouter_api_url
     openrouter_api_key = openrouter_api_key or settings.openrouter_api_key
 
-    assert openrouter_api_url, "OPENROUTER_API_URL is not set"
-    assert openrouter_api_key, "OPENROUTER_API_KEY is not set"
-    assert (
-        model_name
-    ), "Model name is not set, missing 'OPENROUTER_MODEL_NAME' environment variable?"
+    openrouter_api_url = _require(openrouter_api_url, "OPENROUTER_API_URL is not set")
+    openrouter_api_key = _require(openrouter_api_key, "OPENROUTER_API_KEY is not set")
+    model_name = _require(
+        model_name, "Model name is not set, missing 'OPENROUTER_MODEL_NAME' environment variable?"
+    )
 
     provider = OpenAIProvider(base_url=openrouter_api_url, api_key=openrouter_api_key)
     return OpenAIChatModel(model_name, provider=provider)
 
 
+# Models (with their provider SDK clients) reused across agents, keyed on the settings
+# object they were resolved from, so `reload_settings()` yields fresh ones. The settings
+# instance is kept alongside the model so its id cannot be recycled while cached.
+_CachedModel = tuple[Any, AnthropicModel | BedrockConverseModel | OpenAIChatModel]
+_MODELS: dict[tuple[Any, ...], _CachedModel] = {}
+# Judges build agents from worker threads, so two first calls can race on the same key.
+_MODELS_LOCK = threading.Lock()
+
+
 def get_model(
     model_family: str | None = None, model_name: str | None = None, **kwargs: Any
 ) -> AnthropicModel | BedrockConverseModel | OpenAIChatModel:
-    """Create and return appropriate model instance based on specified family and name."""
+    """Return the (cached) model instance for the specified family and name."""
     settings = get_settings()
     model_family = model_family or settings.model_family
 
-    assert (
-        model_family is not None and model_family != ""
-    ), f"Model family '{model_family}' is not set"
+    model_family = _require(model_family, f"Model family '{model_family}' is not set")
+
+    key = (id(settings), model_family, model_name, tuple(sorted(kwargs.items())))
+    cached = _MODELS.get(key)
+    if cached is None:
+        with _MODELS_LOCK:
+            cached = _MODELS.get(key)
+            if cached is None:
+                model = _build_model(model_family, model_name, **kwargs)
+                cached = _MODELS[key] = (settings, model)
+    return cached[1]
 
+
+def _build_model(
+    model_family: str, model_name: str | None, **kwargs: Any
+) -> AnthropicModel | BedrockConverseModel | OpenAIChatModel:
     match model_family:
         case "anthropic":
             return _get_model_anthropic(model_name=model_name, **kwargs)
@@ -174,6 +219,8 @@ def get_agent(
         model_settings = ModelSettings(timeout=settings.model_timeout)
     if model is None:
         model = get_model()
+    if isinstance(model, AnthropicModel | BedrockConverseModel):
+        model_settings = _with_prompt_cache(model, model_settings)
 
     agent = Agent(
         model=model,
@@ -188,6 +235,22 @@ def get_agent(
     return agent
 
 
+def _with_prompt_cache(
+    model: AnthropicModel | BedrockConverseModel, model_settings: ModelSettings
+) -> ModelSettings:
+    """Enable provider prompt caching for the system prompt.
+
+    The judge's system prompt (instructions + rubric) is identical across calls for a
+    case, so marking it cacheable lets Anthropic and Bedrock process and bill it once per
+    cache window. An explicit setting in `model_settings` takes precedence.
+    """
+    if isinstance(model, AnthropicModel):
+        key = "anthropic_cache_instructions"
+    else:
+        key = "bedrock_cache_instructions"
+    return cast(ModelSettings, {key: True, **model_settings})
+
+
 async def run_agent(
     agent: Agent,
     prompt: str | list[str],
@@ -196,16 +259,23 @@ async def run_agent(
     debug: bool = False,
     log_model_requests: bool = False,
     parent_logger: Any | None = None,
+    collect_nodes: bool = True,
 ) -> tuple[Any, list[Any]]:
-    """Query the LLM"""
+    """Query the LLM
+
+    With `collect_nodes=False` the graph nodes are only iterated, not kept, and an empty
+    list is returned; callers that only need the output avoid holding every node.
+    """
     # Results
-    nodes, result = [], None
+    nodes: list[Any] = []
+    result = None
     async with agent.iter(prompt, usage_limits=usage_limits) as agent_run:
         # Note: Logging functionality would need to be implemented based on available libraries
         # For now, we'll just collect nodes and return result
         async for node in agent_run:
             if verbose or debug:
                 print(f"Agent node: {node}")
-            nodes.append(node)
+            if collect_nodes:
+                nodes.append(node)
         result = agent_run.result
     return result.output if result else None, nodes
@@ -1,3 +1,5 @@
+import re
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, Field, ConfigDict, field_validator
@@ -8,6 +10,18 @@ from pondera.models.rubric import RubricCriterion
 # ─────────────────────────────────────────────────────────────────────────────
 
 
+@lru_cache(maxsize=256)
+def _compile_regex(pattern: str) -> re.Pattern[str]:
+    """Compile a pre-judge pattern once per process, keyed on the pattern string."""
+    return re.compile(pattern, flags=re.I | re.M)
+
+
+@lru_cache(maxsize=256)
+def _lower_all(needles: tuple[str, ...]) -> tuple[str, ...]:
+    """Lowercase a list of pre-judge substrings once, keyed on its contents."""
+    return tuple(s.lower() for s in needles)
+
+
 class CaseExpectations(BaseModel):
     """Pre-judge assertions against the produced answer text/markdown."""
 
@@ -17,6 +31,21 @@ class CaseExpectations(BaseModel):
     must_not_contain: list[str] = Field(default_factory=list)
     regex_must_match: list[str] = Field(default_factory=list)
 
+    @property
+    def compiled_regexes(self) -> list[re.Pattern[str]]:
+        """The current `regex_must_match` patterns, compiled case-insensitive and multiline."""
+        return [_compile_regex(p) for p in self.regex_must_match]
+
+    @property
+    def lowered_must_contain(self) -> tuple[str, ...]:
+        """The current `must_contain` needles lowercased, parallel to the original list."""
+        return _lower_all(tuple(self.must_contain))
+
+    @property
+    def lowered_must_not_contain(self) -> tuple[str, ...]:
+        """The current `must_not_contain` needles lowercased, parallel to the original list."""
+        return _lower_all(tuple(self.must_not_contain))
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Case input (what the runner will receive)
@@ -1,4 +1,4 @@
-from statistics import mean, median, pstdev, pvariance
+import math
 from pydantic import BaseModel, Field, ConfigDict
 from enum import Enum
 from pondera.models.evaluation import EvaluationResult
@@ -21,19 +21,41 @@ class ScoreAggregate(BaseModel):
     stdev: float = Field(description="Population standard deviation (σ).")
     variance: float = Field(description="Population variance (σ²).")
 
+    @classmethod
+    def from_value(cls, value: float, metric: AggregationMetric) -> "ScoreAggregate":
+        """Aggregate of a single sample: every location statistic is `value`, spread is 0."""
+        return cls(
+            metric=metric,
+            min=value,
+            max=value,
+            mean=value,
+            median=value,
+            stdev=0.0,
+            variance=0.0,
+        )
+
 
 def aggregate_numbers(values: list[float], metric: AggregationMetric) -> ScoreAggregate:
-    """Aggregate a list of numeric values computing standard statistics."""
+    """Aggregate a list of numeric values computing standard statistics.
+
+    Sorts once for min/max/median and computes the variance with a float two-pass sum
+    (`statistics.pvariance` works in exact fractions, which dominates at high repetitions).
+    """
     if not values:
         raise ValueError("Cannot aggregate empty value list")
+    ordered = sorted(values)
+    n = len(ordered)
+    mid = n // 2
+    avg = math.fsum(ordered) / n
+    variance = math.fsum((x - avg) ** 2 for x in ordered) / n if n > 1 else 0.0
     return ScoreAggregate(
         metric=metric,
-        min=min(values),
-        max=max(values),
-        mean=mean(values),
-        median=median(values),
-        stdev=pstdev(values) if len(values) > 1 else 0.0,
-        variance=pvariance(values) if len(values) > 1 else 0.0,
+        min=ordered[0],
+        max=ordered[-1],
+        mean=avg,
+        median=ordered[mid] if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2,
+        stdev=math.sqrt(variance),
+        variance=variance,
     )
 
 
@@ -42,6 +64,19 @@ class CriteriaAggregates(BaseModel):
     overall: ScoreAggregate
     per_criterion: dict[str, ScoreAggregate]
 
+    @classmethod
+    def from_singleton(
+        cls, ev: EvaluationResult, metric: AggregationMetric
+    ) -> "CriteriaAggregates":
+        """Trivial aggregates for a single evaluation, skipping the statistics pass."""
+        return cls(
+            overall=ScoreAggregate.from_value(float(ev.judgment.score), metric),
+            per_criterion={
+                k: ScoreAggregate.from_value(float(v), metric)
+                for k, v in sorted(ev.judgment.criteria_scores.items())
+            },
+        )
+
 
 class MultiEvaluationResult(BaseModel):
     """Result of executing the same case multiple times to measure reproducibility."""
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import os
 from functools import lru_cache
-from typing import Any
+from typing import Annotated, Any
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -45,6 +45,11 @@ class PonderaSettings(BaseSettings):
     model_timeout: int = 120
     model_family: str | None = None
 
+    # Concurrency limits for runner/judge calls (None = unlimited); per-key overrides
+    # are keyed on "runner" or the judge model family (e.g. {"openai": 32}).
+    max_concurrency: int | None = Field(default=None, ge=1)
+    provider_max_concurrency: dict[str, Annotated[int, Field(ge=1)]] = Field(default_factory=dict)
+
     # Azure models (additional fields)
     azure_model_name: str | None = None
     azure_openai_api_version: str | None = None
@@ -1,7 +1,6 @@
-import re
+from functools import lru_cache
 from pathlib import Path
-
-import yaml
+from typing import Any, Callable
 
 from pondera.models.case import CaseSpec
 from pondera.errors import ValidationError
@@ -15,16 +14,17 @@ def apply_prejudge_checks(answer_md: str, case: CaseSpec) -> list[str]:
     """
     failures: list[str] = []
     exp = case.expect
-    low = answer_md.lower()
-    for s in exp.must_contain:
-        if s.lower() not in low:
+    # Only pay for a lowercased copy of the answer when there are substrings to look for.
+    low = answer_md.lower() if exp.must_contain or exp.must_not_contain else ""
+    for s, needle in zip(exp.must_contain, exp.lowered_must_contain):
+        if needle not in low:
             failures.append(f"must_contain failed: {s!r}")
-    for s in exp.must_not_contain:
-        if s.lower() in low:
+    for s, needle in zip(exp.must_not_contain, exp.lowered_must_not_contain):
+        if needle in low:
             failures.append(f"must_not_contain failed: {s!r}")
-    for pattern in exp.regex_must_match:
-        if not re.search(pattern, answer_md, flags=re.I | re.M):
-            failures.append(f"regex_must_match failed: {pattern!r}")
+    for rx in exp.compiled_regexes:
+        if not rx.search(answer_md):
+            failures.append(f"regex_must_match failed: {rx.pattern!r}")
     return failures
 
 
@@ -54,11 +54,12 @@ def compute_pass(
     if overall_score < overall_threshold:
         return False
     for k, th in (per_criterion_thresholds or {}).items():
-        if k not in criteria_scores:
+        score = criteria_scores.get(k)
+        if score is None:
             raise ValidationError(
                 f"Missing criterion score for threshold key '{k}' (fail-fast instead of defaulting to 0)"
             )
-        if criteria_scores[k] < th:
+        if score < th:
             return False
     return True
 
@@ -94,16 +95,45 @@ def default_rubric() -> list[RubricCriterion]:
     ]
 
 
-def load_case_yaml(path: str | Path) -> CaseSpec:
-    """Load a YAML case file into a CaseSpec, raising ValidationError on schema issues."""
+@lru_cache(maxsize=256)
+def _load_case_yaml_cached(path: str, mtime_ns: int, size: int) -> CaseSpec:
+    """Parse and validate a case file; keyed on (path, mtime_ns, size) so edits invalidate.
+
+    `.json` cases (JSON is a YAML subset) skip the YAML parser and are parsed and validated
+    in a single pass by pydantic-core.
+    """
     p = Path(path)
-    data = yaml.safe_load(p.read_text(encoding="utf-8"))
+    if p.suffix == ".json":
+        source: Any = p.read_bytes()
+        validate: Callable[[Any], CaseSpec] = CaseSpec.model_validate_json
+    else:
+        import yaml  # deferred: only case loading needs it (~20 ms import)
+
+        # libyaml's C loader parses several times faster; PyYAML builds without libyaml lack it.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        source = yaml.load(p.read_text(encoding="utf-8"), Loader=loader)
+        validate = CaseSpec.model_validate
     try:
-        return CaseSpec.model_validate(data)
+        return validate(source)
     except Exception as ex:  # pydantic.ValidationError or other
         raise ValidationError(f"Invalid CaseSpec YAML '{path}': {ex}") from ex
 
 
+def load_case_yaml(path: str | Path) -> CaseSpec:
+    """Load a YAML case file into a CaseSpec, raising ValidationError on schema issues.
+
+    Parsed specs are cached until the file changes; callers get a deep copy so
+    mutating the returned spec never affects later loads.
+    """
+    # Absolute, so a relative path loaded from another working directory is a different key.
+    p = Path(path).absolute()
+    st = p.stat()
+    return _load_case_yaml_cached(str(p), st.st_mtime_ns, st.st_size).model_copy(deep=True)
+
+
+load_case_yaml.cache_clear = _load_case_yaml_cached.cache_clear  # type: ignore[attr-defined]
+
+
 def rubric_to_markdown(rubric: list[RubricCriterion]) -> str:
     """Render rubric as concise markdown bullet list with weights."""
     return "\n".join(f"- **{c.name}** (w={c.weight:g}): {c.description}" for c in rubric)
@@ -9,6 +9,7 @@ from unittest.mock import patch, AsyncMock
 from pondera.api import evaluate_case_async, evaluate_case
 from pondera.models.multi_evaluation import MultiEvaluationResult
 from pondera.judge.base import Judge
+from pondera.models.judgment import Judgment
 from tests.integration.test_runner import TestRunner, MathTestRunner
 
 
@@ -31,8 +32,6 @@ class TestAPIIntegration:
             mock_get_agent.return_value = mock_agent
 
             # Mock the judgment result
-            from pondera.models.judgment import Judgment
-
             mock_judgment = Judgment(
                 score=90.0,
                 evaluation_passed=True,
@@ -69,8 +68,6 @@ class TestAPIIntegration:
         ):
             mock_agent = AsyncMock()
             mock_get_agent.return_value = mock_agent
-            from pondera.models.judgment import Judgment
-
             mock_judgment = Judgment(
                 score=90.0,
                 evaluation_passed=True,
@@ -104,8 +101,6 @@ class TestAPIIntegration:
         ):
             mock_agent = AsyncMock()
             mock_get_agent.return_value = mock_agent
-            from pondera.models.judgment import Judgment
-
             mock_judgment = Judgment(
                 score=95.0,
                 evaluation_passed=True,
@@ -141,8 +136,6 @@ class TestAPIIntegration:
         ):
             mock_agent = AsyncMock()
             mock_get_agent.return_value = mock_agent
-            from pondera.models.judgment import Judgment
-
             mock_judgment = Judgment(
                 score=85.0,
                 evaluation_passed=True,
@@ -177,8 +170,6 @@ class TestAPIIntegration:
         ):
             mock_agent = AsyncMock()
             mock_get_agent.return_value = mock_agent
-            from pondera.models.judgment import Judgment
-
             mock_judgment = Judgment(
                 score=75.0,
                 evaluation_passed=True,
@@ -217,8 +208,6 @@ class TestAPIIntegration:
         ):
             mock_agent = AsyncMock()
             mock_get_agent.return_value = mock_agent
-            from pondera.models.judgment import Judgment
-
             mock_judgment = Judgment(
                 score=20.0,
                 evaluation_passed=False,
@@ -2,10 +2,21 @@ import json
 import tempfile
 from pathlib import Path
 
-from pondera.io.artifacts import _slug, _summary_md, write_case_artifacts
+from pondera.io.artifacts import (
+    _slug,
+    _summary_md,
+    write_case_artifacts,
+    write_multi_evaluation_artifacts,
+)
 from pondera.models.case import CaseSpec, CaseInput
 from pondera.models.evaluation import EvaluationResult
 from pondera.models.judgment import Judgment
+from pondera.models.multi_evaluation import (
+    AggregationMetric,
+    CriteriaAggregates,
+    MultiEvaluationResult,
+    aggregate_numbers,
+)
 from pondera.models.run import RunResult
 
 
@@ -439,8 +450,11 @@ class TestWriteCaseArtifacts:
 
             # Verify unicode in JSON
             judgment_file = case_dir / "judgment.json"
-            judgment_data = json.loads(judgment_file.read_text(encoding="utf-8"))
+            judgment_text = judgment_file.read_text(encoding="utf-8")
+            judgment_data = json.loads(judgment_text)
             assert "café ☕" in judgment_data["reasoning"]
+            # Same layout as json.dumps(indent=2, ensure_ascii=False)
+            assert judgment_text == json.dumps(judgment_data, indent=2, ensure_ascii=False)
             # has_judge_prompt should be false (no prompt set in test object)
             meta_file = case_dir / "meta.json"
             meta_data = json.loads(meta_file.read_text(encoding="utf-8"))
@@ -475,3 +489,49 @@ class TestWriteCaseArtifacts:
             assert "SYSTEM:" in prompt_text
             meta = json.loads((case_dir / "meta.json").read_text(encoding="utf-8"))
             assert meta["has_judge_prompt"] is True
+
+
+class TestWriteMultiEvaluationArtifacts:
+    """Tests for the write_multi_evaluation_artifacts function."""
+
+    def test_layout(self) -> None:
+        case = CaseSpec(id="Multi Case", input=CaseInput(query="q"))
+        evaluations = [
+            EvaluationResult(
+                case_id=case.id,
+                case=case,
+                run=RunResult(question="q", answer=f"answer {i}"),
+                judgment=Judgment(
+                    score=score,
+                    evaluation_passed=True,
+                    reasoning="r",
+                    criteria_scores={"quality": score},
+                ),
+                overall_threshold=70,
+                passed=True,
+            )
+            for i, score in enumerate([80, 90], start=1)
+        ]
+        per_criterion = {"quality": aggregate_numbers([80, 90], AggregationMetric.mean)}
+        multi = MultiEvaluationResult(
+            case_id=case.id,
+            evaluations=evaluations,
+            aggregates=CriteriaAggregates(
+                overall=per_criterion["quality"], per_criterion=per_criterion
+            ),
+            passed=True,
+            primary_metric=AggregationMetric.mean,
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base = write_multi_evaluation_artifacts(temp_dir, multi)
+
+            assert base == Path(temp_dir) / "multi-case" / "multi"
+            for idx in (1, 2):
+                case_dir = base / "evaluations" / f"{idx:03d}" / "multi-case"
+                answer = (case_dir / "answer.md").read_text(encoding="utf-8")
+                assert answer == f"answer {idx}"
+                assert (case_dir / "summary.md").exists()
+            aggregates = json.loads((base / "aggregates.json").read_text(encoding="utf-8"))
+            assert aggregates["overall"]["mean"] == 85.0
+            assert aggregates["per_criterion"]["quality"]["metric"] == "mean"
+            assert (base / "summary.md").exists()
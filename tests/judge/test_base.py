@@ -1,5 +1,9 @@
+import asyncio
+import time
+
 import pytest
 from unittest.mock import Mock, patch
+from pathlib import Path
 from typing import Any
 
 from pondera.judge.base import Judge, JudgeError
@@ -131,3 +135,91 @@ async def test_judge_calls_get_agent_with_tools(
     assert call_kwargs["tools"] == (sample_tool,)
     assert call_kwargs["output_type"] == Judgment
     mock_run_agent.assert_called_once()
+
+
+@patch("pondera.judge.base.get_agent")
+@patch("pondera.judge.base.run_agent")
+@pytest.mark.asyncio
+async def test_prepare_builds_agent_reused_by_judge(
+    mock_run_agent: Any, mock_get_agent: Any
+) -> None:
+    rubric = [RubricCriterion(name="accuracy", weight=1.0, description="How accurate")]
+    mock_get_agent.return_value = Mock()
+    mock_run_agent.return_value = (
+        Judgment(
+            score=90, evaluation_passed=True, reasoning="ok", criteria_scores={"accuracy": 90}
+        ),
+        [],
+    )
+    judge = Judge(rubric=rubric)
+    await judge.prepare(system_append="Be strict")
+    mock_get_agent.assert_called_once()
+
+    await judge.judge(
+        question="q", answer="a", files=[], judge_request="r", system_append="Be strict"
+    )
+    mock_get_agent.assert_called_once()
+    assert mock_run_agent.call_args.args[0] is mock_get_agent.return_value
+
+    await judge.judge(question="q", answer="a", files=[], judge_request="r")
+    assert mock_get_agent.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_prepares_build_agent_once() -> None:
+    def _slow_get_agent(**kwargs: Any) -> Mock:
+        time.sleep(0.02)
+        return Mock()
+
+    with patch("pondera.judge.base.get_agent", side_effect=_slow_get_agent) as mock_get_agent:
+        judge = Judge(rubric=[RubricCriterion(name="accuracy", weight=1.0, description="d")])
+        await asyncio.gather(*(judge.prepare(system_append="x") for _ in range(8)))
+    assert mock_get_agent.call_count == 1
+
+
+@patch("pondera.judge.base.get_agent")
+@patch("pondera.judge.base.run_agent")
+@pytest.mark.asyncio
+async def test_system_prompt_rendered_once_per_rubric(
+    mock_run_agent: Any, mock_get_agent: Any
+) -> None:
+    mock_run_agent.return_value = (
+        Judgment(score=1, evaluation_passed=False, reasoning="r", criteria_scores={"c": 1}),
+        [],
+    )
+    judge = Judge()
+    with patch.object(Judge, "_system_prompt", autospec=True, return_value="sys") as render:
+        for _ in range(3):
+            # Equal rubrics built afresh each call, as per-case YAML loading does.
+            rubric = [RubricCriterion(name="c", weight=1.0, description="d")]
+            await judge.judge(question="q", answer="a", files=[], judge_request="r", rubric=rubric)
+
+    render.assert_called_once()
+    mock_get_agent.assert_called_once()
+
+
+@patch("pondera.judge.base.get_agent")
+@patch("pondera.judge.base.run_agent")
+@pytest.mark.asyncio
+async def test_judge_inlines_file_snippets(
+    mock_run_agent: Any, mock_get_agent: Any, tmp_path: Path
+) -> None:
+    (tmp_path / "ok.txt").write_text("hello file", encoding="utf-8")
+    (tmp_path / "bin.dat").write_bytes(b"ab\x00cd")
+    (tmp_path / "big.txt").write_bytes(b"x" * 20_001)
+    (tmp_path / "subdir").mkdir()
+    files = [str(tmp_path / n) for n in ("ok.txt", "bin.dat", "big.txt", "subdir", "nope.txt")]
+    mock_run_agent.return_value = (
+        Judgment(score=1, evaluation_passed=False, reasoning="r", criteria_scores={"c": 1}),
+        [],
+    )
+    judge = Judge(rubric=[RubricCriterion(name="c", weight=1.0, description="d")])
+
+    await judge.judge(question="q", answer="a", files=files, judge_request="r")
+
+    prompt = mock_run_agent.call_args[0][1]
+    assert f"--- {files[0]} (10 bytes) ---\nhello file" in prompt
+    assert f"--- {files[1]} (skipped: binary) ---" in prompt
+    assert f"--- {files[2]} (skipped: 20001 bytes > 20000) ---" in prompt
+    assert f"--- {files[3]} (missing) ---" in prompt
+    assert f"--- {files[4]} (missing) ---" in prompt
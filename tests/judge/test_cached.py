@@ -0,0 +1,168 @@
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+
+from pondera.judge import CachedJudge
+from pondera.models.judgment import Judgment
+from pondera.models.rubric import RubricCriterion
+
+
+class CountingJudge:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def judge(self, **kwargs: object) -> Judgment:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return Judgment(
+            score=90,
+            evaluation_passed=True,
+            reasoning=f"answer={kwargs['answer']}",
+            criteria_scores={"overall": 90},
+        )
+
+
+def _kwargs(answer: str = "a") -> dict[str, object]:
+    return dict(
+        question="q",
+        answer=answer,
+        files=None,
+        judge_request="r",
+        rubric=[RubricCriterion(name="overall", weight=1.0, description="d")],
+    )
+
+
+@pytest.mark.asyncio
+async def test_identical_inputs_judged_once() -> None:
+    inner = CountingJudge()
+    judge = CachedJudge(inner)
+
+    first = await judge.judge(**_kwargs())
+    second = await judge.judge(**_kwargs())
+
+    assert inner.calls == 1
+    assert first == second
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_inputs_share_one_call() -> None:
+    inner = CountingJudge()
+    judge = CachedJudge(inner)
+
+    results = await asyncio.gather(*(judge.judge(**_kwargs()) for _ in range(5)))
+
+    assert inner.calls == 1
+    assert all(r.score == 90 for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_owner_does_not_cancel_waiters() -> None:
+    inner = CountingJudge()
+    judge = CachedJudge(inner)
+
+    owner = asyncio.create_task(judge.judge(**_kwargs()))
+    await asyncio.sleep(0)  # owner is now inside the inner judge
+    waiter = asyncio.create_task(judge.judge(**_kwargs()))
+    await asyncio.sleep(0)  # waiter has joined the pending call
+    owner.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+    result = await waiter
+
+    assert result.score == 90
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_rewritten_files_are_judged_again(tmp_path: Path) -> None:
+    inner = CountingJudge()
+    judge = CachedJudge(inner)
+    report = tmp_path / "report.md"
+    kwargs = {**_kwargs(), "files": [str(report)]}
+
+    report.write_text("first draft")
+    await judge.judge(**kwargs)
+    await judge.judge(**kwargs)
+    assert inner.calls == 1
+
+    report.write_text("second, longer draft")
+    await judge.judge(**kwargs)
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_different_answers_and_eviction() -> None:
+    inner = CountingJudge()
+    judge = CachedJudge(inner, maxsize=1)
+
+    await judge.judge(**_kwargs("a"))
+    await judge.judge(**_kwargs("b"))
+    await judge.judge(**_kwargs("a"))
+
+    assert inner.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_failures_are_not_cached() -> None:
+    class FlakyJudge(CountingJudge):
+        async def judge(self, **kwargs: object) -> Judgment:
+            if self.calls == 0:
+                self.calls += 1
+                raise RuntimeError("boom")
+            return await super().judge(**kwargs)
+
+    inner = FlakyJudge()
+    judge = CachedJudge(inner)
+
+    with pytest.raises(RuntimeError):
+        await judge.judge(**_kwargs())
+    result = await judge.judge(**_kwargs())
+
+    assert result.score == 90
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_persistent_cache_reused_across_instances(tmp_path: Path) -> None:
+    db = tmp_path / "cache" / "judgments.sqlite"
+    first_inner = CountingJudge()
+    first = await CachedJudge(first_inner, path=db, namespace="gpt-4o").judge(**_kwargs())
+
+    second_inner = CountingJudge()
+    second = await CachedJudge(second_inner, path=db, namespace="gpt-4o").judge(**_kwargs())
+    assert first_inner.calls == 1
+    assert second_inner.calls == 0
+    assert second == first
+
+    other_inner = CountingJudge()
+    await CachedJudge(other_inner, path=db, namespace="claude").judge(**_kwargs())
+    assert other_inner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_persistent_cache_keys_files_on_contents(tmp_path: Path) -> None:
+    db = tmp_path / "judgments.sqlite"
+    report = tmp_path / "report.md"
+    kwargs = {**_kwargs(), "files": [str(report)]}
+
+    report.write_text("draft")
+    first_inner = CountingJudge()
+    await CachedJudge(first_inner, path=db).judge(**kwargs)
+
+    # Regenerated by a later run with the same contents: reused despite the new mtime.
+    report.write_text("draft")
+    os.utime(report, ns=(0, 0))
+    second_inner = CountingJudge()
+    await CachedJudge(second_inner, path=db).judge(**kwargs)
+
+    # Same size and mtime but different contents: judged again.
+    report.write_text("DRAFT")
+    os.utime(report, ns=(0, 0))
+    third_inner = CountingJudge()
+    await CachedJudge(third_inner, path=db).judge(**kwargs)
+
+    assert (first_inner.calls, second_inner.calls, third_inner.calls) == (1, 0, 1)
@@ -5,6 +5,15 @@ from typing import Any
 from pondera.judge.base import Judge, JudgeError
 from pondera.models.rubric import RubricCriterion
 from pondera.models.judgment import Judgment
+from pondera.judge.pydantic_ai import (
+    _azure_openai_client,
+    _get_model_anthropic,
+    _get_model_openai,
+    _get_model_openai_azure,
+    get_agent,
+    run_agent,
+    get_model,
+)
 
 
 class TestJudge:
@@ -165,3 +174,113 @@ class TestJudge:
         assert "Extra instructions" in system_prompt
         assert "Judgment" in system_prompt
         assert "0-100" in system_prompt
+
+
+class TestAzureClientReuse:
+    """Azure models share one OpenAI client per endpoint."""
+
+    def test_same_endpoint_reuses_client(self) -> None:
+        _azure_openai_client.cache_clear()
+        kwargs = dict(
+            azure_openai_api_key="key",
+            azure_openai_endpoint="https://example.openai.azure.com",
+            azure_openai_api_version="2024-06-01",
+        )
+        first = _get_model_openai_azure(model_name="gpt-4o", **kwargs)
+        second = _get_model_openai_azure(model_name="gpt-4o-mini", **kwargs)
+
+        assert first.client is second.client
+        assert _azure_openai_client.cache_info().hits == 1
+
+
+class TestModelReuse:
+    """get_model hands out one model per settings object and arguments."""
+
+    def test_same_arguments_reuse_model(self) -> None:
+        settings = Mock(model_family="openai", openai_api_key="key", openai_model_name="gpt-4o")
+        with patch("pondera.judge.pydantic_ai.get_settings", return_value=settings):
+            first = get_model()
+            assert get_model() is first
+            assert get_model(model_name="gpt-4o-mini") is not first
+
+        reloaded = Mock(model_family="openai", openai_api_key="key", openai_model_name="gpt-4o")
+        with patch("pondera.judge.pydantic_ai.get_settings", return_value=reloaded):
+            assert get_model() is not first
+
+
+class TestMissingSettings:
+    """Missing provider settings raise ValueError (not assert, which -O strips)."""
+
+    def test_missing_api_key_raises(self) -> None:
+        settings = Mock(model_family="openai", openai_api_key=None, openai_model_name="gpt-4o")
+        with patch("pondera.judge.pydantic_ai.get_settings", return_value=settings):
+            with pytest.raises(ValueError, match="OPENAI_API_KEY is not set"):
+                get_model()
+
+    def test_missing_model_family_raises(self) -> None:
+        settings = Mock(model_family="")
+        with patch("pondera.judge.pydantic_ai.get_settings", return_value=settings):
+            with pytest.raises(ValueError, match="is not set"):
+                get_model()
+
+
+class TestPromptCaching:
+    """get_agent marks the system prompt cacheable where the provider supports it."""
+
+    @staticmethod
+    def _settings(model: Any, **kwargs: Any) -> Any:
+        with patch("pondera.judge.pydantic_ai.Agent") as agent_cls:
+            get_agent(model, **kwargs)
+        return agent_cls.call_args.kwargs["model_settings"]
+
+    def test_anthropic_caches_instructions(self) -> None:
+        settings = self._settings(_get_model_anthropic(anthropic_api_key="key"))
+        assert settings["anthropic_cache_instructions"] is True
+        assert "timeout" in settings
+
+    def test_explicit_setting_wins(self) -> None:
+        model = _get_model_anthropic(anthropic_api_key="key")
+        settings = self._settings(model, model_settings={"anthropic_cache_instructions": False})
+        assert settings["anthropic_cache_instructions"] is False
+
+    def test_openai_unchanged(self) -> None:
+        model = _get_model_openai(model_name="gpt-4o", openai_api_key="key")
+        assert "anthropic_cache_instructions" not in self._settings(model)
+
+
+class TestRunAgent:
+    """run_agent drives the agent graph and optionally keeps its nodes."""
+
+    @staticmethod
+    def _agent(nodes: list[Any]) -> Any:
+        class _Run:
+            result = Mock(output="done")
+
+            async def __aenter__(self) -> "_Run":
+                return self
+
+            async def __aexit__(self, *exc: Any) -> None:
+                return None
+
+            def __aiter__(self) -> Any:
+                async def gen() -> Any:
+                    for node in nodes:
+                        yield node
+
+                return gen()
+
+        agent = Mock()
+        agent.iter.return_value = _Run()
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_collects_nodes_by_default(self) -> None:
+        output, nodes = await run_agent(self._agent(["a", "b"]), "prompt")
+        assert output == "done"
+        assert nodes == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_collect_nodes_false_keeps_none(self) -> None:
+        output, nodes = await run_agent(self._agent(["a", "b"]), "prompt", collect_nodes=False)
+        assert output == "done"
+        assert nodes == []
@@ -1,8 +1,11 @@
+import re
+
 import pytest
 from pydantic import ValidationError
 
 from pondera.models.case import CaseExpectations, CaseInput, CaseJudge, CaseSpec
 from pondera.models.rubric import RubricCriterion
+from pondera.utils import apply_prejudge_checks
 
 
 class TestCaseExpectations:
@@ -28,6 +31,55 @@ class TestCaseExpectations:
         assert expectations.must_not_contain == ["error", "fail"]
         assert expectations.regex_must_match == [r"\d+", r"[A-Z]+"]
 
+    def test_compiled_regexes(self) -> None:
+        """Patterns are compiled with case-insensitive, multiline flags and reused."""
+        expectations = CaseExpectations(regex_must_match=[r"^answer", r"\d+"])
+
+        compiled = expectations.compiled_regexes
+
+        assert [rx.pattern for rx in compiled] == [r"^answer", r"\d+"]
+        assert all(rx.flags & re.I and rx.flags & re.M for rx in compiled)
+        assert expectations.compiled_regexes[0] is compiled[0]
+
+    def test_compiled_regexes_follow_mutation(self) -> None:
+        """Reassigning or extending `regex_must_match` is reflected in the compiled list."""
+        expectations = CaseExpectations(regex_must_match=[r"^answer"])
+        assert [rx.pattern for rx in expectations.compiled_regexes] == [r"^answer"]
+
+        expectations.regex_must_match = ["berlin"]
+        assert [rx.pattern for rx in expectations.compiled_regexes] == ["berlin"]
+
+        expectations.regex_must_match.append("paris")
+        assert [rx.pattern for rx in expectations.compiled_regexes] == ["berlin", "paris"]
+
+    def test_lowered_substrings(self) -> None:
+        """Substring needles are lowercased in the original order and follow edits."""
+        expectations = CaseExpectations(must_contain=["Hello", "WORLD"], must_not_contain=["Err"])
+
+        assert expectations.lowered_must_contain == ("hello", "world")
+        assert expectations.lowered_must_not_contain == ("err",)
+
+        expectations.must_contain.append("Again")
+        expectations.must_not_contain = []
+
+        assert expectations.lowered_must_contain == ("hello", "world", "again")
+        assert expectations.lowered_must_not_contain == ()
+
+    def test_prejudge_checks_follow_mutation(self) -> None:
+        """Expectations edited after a first check are honoured by the next one."""
+        case = CaseSpec(
+            id="mutated", input=CaseInput(query="q"), expect=CaseExpectations(must_contain=["p"])
+        )
+        assert apply_prejudge_checks("Paris", case) == []
+
+        case.expect.must_contain = ["paris", "france"]
+        case.expect.regex_must_match = ["berlin"]
+
+        assert apply_prejudge_checks("Paris", case) == [
+            "must_contain failed: 'france'",
+            "regex_must_match failed: 'berlin'",
+        ]
+
 
 class TestCaseInput:
     """Tests for CaseInput model."""
@@ -0,0 +1,80 @@
+import statistics
+
+import pytest
+
+from pondera.models.case import CaseInput, CaseSpec
+from pondera.models.evaluation import EvaluationResult
+from pondera.models.judgment import Judgment
+from pondera.models.multi_evaluation import (
+    AggregationMetric,
+    CriteriaAggregates,
+    ScoreAggregate,
+    aggregate_numbers,
+)
+from pondera.models.run import RunResult
+
+
+class TestAggregateNumbers:
+    """Tests for aggregate_numbers."""
+
+    def test_matches_statistics_module(self) -> None:
+        values = [70.0, 80.0, 95.0, 60.0]
+        agg = aggregate_numbers(values, AggregationMetric.mean)
+
+        assert agg.metric == AggregationMetric.mean
+        assert agg.min == 60.0
+        assert agg.max == 95.0
+        assert agg.mean == pytest.approx(statistics.mean(values))
+        assert agg.median == statistics.median(values)
+        assert agg.variance == pytest.approx(statistics.pvariance(values))
+        assert agg.stdev == pytest.approx(statistics.pstdev(values))
+
+    def test_odd_count_many_values(self) -> None:
+        values = [float((i * 37) % 101) for i in range(301)]
+        agg = aggregate_numbers(values, AggregationMetric.median)
+
+        assert agg.median == statistics.median(values)
+        assert agg.mean == pytest.approx(statistics.fmean(values))
+        assert agg.variance == pytest.approx(statistics.pvariance(values))
+        assert agg.stdev == pytest.approx(statistics.pstdev(values))
+
+    def test_single_value(self) -> None:
+        agg = aggregate_numbers([42.0], AggregationMetric.max)
+
+        assert agg.min == agg.max == agg.mean == agg.median == 42.0
+        assert agg.stdev == 0.0
+        assert agg.variance == 0.0
+
+    def test_empty_raises(self) -> None:
+        with pytest.raises(ValueError, match="empty"):
+            aggregate_numbers([], AggregationMetric.mean)
+
+
+class TestSingletonAggregates:
+    """Tests for the single-sample aggregate constructors."""
+
+    def test_score_aggregate_from_value(self) -> None:
+        agg = ScoreAggregate.from_value(55.0, AggregationMetric.median)
+
+        assert agg == aggregate_numbers([55.0], AggregationMetric.median)
+
+    def test_criteria_aggregates_from_singleton(self) -> None:
+        ev = EvaluationResult(
+            case_id="c",
+            case=CaseSpec(id="c", input=CaseInput(query="q")),
+            run=RunResult(question="q", answer="a"),
+            judgment=Judgment(
+                score=80,
+                evaluation_passed=True,
+                reasoning="ok",
+                criteria_scores={"clarity": 70, "accuracy": 90},
+            ),
+            overall_threshold=50,
+            passed=True,
+        )
+
+        aggs = CriteriaAggregates.from_singleton(ev, AggregationMetric.mean)
+
+        assert aggs.overall == aggregate_numbers([80.0], AggregationMetric.mean)
+        assert list(aggs.per_criterion) == ["accuracy", "clarity"]
+        assert aggs.per_criterion["clarity"] == aggregate_numbers([70.0], AggregationMetric.mean)
@@ -2,13 +2,29 @@
 
 import pytest
 import asyncio
+import gc
+import os
+import subprocess
+import sys
+import threading
 from unittest.mock import AsyncMock, patch
 from pathlib import Path
 from typing import Any
 
-from pondera.api import evaluate_case_async, evaluate_case
-from pondera.errors import ValidationError
+import pondera
+import pydantic
+from pondera.api import (
+    _aggregate_multi_evaluations,
+    _HOLDERS,
+    _get_persistent_loop,
+    _new_event_loop,
+    evaluate_case_async,
+    evaluate_case,
+    evaluate_cases_async,
+)
+from pondera.errors import JudgeError, ValidationError
 from pondera.models.case import CaseSpec, CaseInput, CaseJudge
+from pondera.models.evaluation import EvaluationResult
 from pondera.models.judgment import Judgment
 from pondera.models.run import RunResult
 from pondera.models.rubric import RubricCriterion
@@ -381,6 +397,274 @@ class TestEvaluateCaseAsync:
             assert result.passed is True
             assert result.primary_metric == AggregationMetric.max
 
+    @pytest.mark.asyncio
+    async def test_evaluate_case_async_prepares_judge_during_runner(
+        self, sample_case: CaseSpec, sample_rubric: list[RubricCriterion]
+    ) -> None:
+        events: list[str] = []
+
+        class SlowRunner(MockRunner):
+            async def run(self, **kwargs: Any) -> RunResult:
+                await asyncio.sleep(0.05)
+                events.append("runner done")
+                return await super().run(**kwargs)
+
+        class PreparingJudge(MockJudge):
+            async def prepare(
+                self, *, rubric: list[RubricCriterion] | None = None, system_append: str = ""
+            ) -> None:
+                events.append("prepare")
+                self.prepared_with = (rubric, system_append)
+
+        judge = PreparingJudge()
+        with (
+            patch("pondera.api.load_case_yaml", return_value=sample_case),
+            patch("pondera.api.get_settings"),
+            patch("pondera.api.apply_prejudge_checks", return_value=[]),
+            patch("pondera.api.choose_rubric", return_value=sample_rubric),
+            patch("pondera.api.compute_pass", return_value=True),
+        ):
+            await evaluate_case_async("/fake/path.yaml", runner=SlowRunner(), judge=judge)
+        assert events == ["prepare", "runner done"]
+        assert judge.prepared_with == (sample_rubric, "")
+        assert judge.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_evaluate_case_async_cancels_prepare_when_runner_raises(
+        self, sample_case: CaseSpec, sample_rubric: list[RubricCriterion]
+    ) -> None:
+        runner_started = asyncio.Event()
+        prepare_cancelled = asyncio.Event()
+
+        class HangingRunner(MockRunner):
+            async def run(self, **kwargs: Any) -> RunResult:
+                runner_started.set()
+                await asyncio.sleep(10)
+                return await super().run(**kwargs)
+
+        class SlowPreparingJudge(MockJudge):
+            async def prepare(
+                self, *, rubric: list[RubricCriterion] | None = None, system_append: str = ""
+            ) -> None:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    prepare_cancelled.set()
+                    raise
+
+        judge = SlowPreparingJudge()
+        with (
+            patch("pondera.api.load_case_yaml", return_value=sample_case),
+            patch("pondera.api.get_settings"),
+            patch("pondera.api.choose_rubric", return_value=sample_rubric),
+        ):
+            task = asyncio.create_task(
+                evaluate_case_async("/fake/path.yaml", runner=HangingRunner(), judge=judge)
+            )
+            await runner_started.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        assert prepare_cancelled.is_set()
+        assert judge.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_evaluate_case_async_writes_artifacts_off_loop(
+        self, sample_case: CaseSpec, tmp_path: Path
+    ) -> None:
+        writer_threads: list[threading.Thread] = []
+
+        def _record(root: Any, multi: MultiEvaluationResult) -> Path:
+            writer_threads.append(threading.current_thread())
+            return Path(root)
+
+        with (
+            patch("pondera.api.load_case_yaml", return_value=sample_case),
+            patch("pondera.api.apply_prejudge_checks", return_value=[]),
+            patch("pondera.api.choose_rubric", return_value=None),
+            patch("pondera.api.compute_pass", return_value=True),
+            patch("pondera.api.write_multi_evaluation_artifacts", side_effect=_record),
+        ):
+            await evaluate_case_async(
+                "/fake/path.yaml", runner=MockRunner(), judge=MockJudge(), artifacts_root=tmp_path
+            )
+        assert len(writer_threads) == 1
+        assert writer_threads[0] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_evaluate_case_async_repetitions_run_concurrently(
+        self, sample_case: CaseSpec
+    ) -> None:
+        multi_case = CaseSpec(
+            id=sample_case.id,
+            input=sample_case.input,
+            judge=sample_case.judge,
+            repetitions=4,
+        )
+
+        class TrackingRunner(MockRunner):
+            def __init__(self) -> None:
+                super().__init__(delay=0.05)
+                self.active = 0
+                self.max_active = 0
+
+            async def run(self, **kwargs: Any) -> RunResult:
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+                try:
+                    return await super().run(**kwargs)
+                finally:
+                    self.active -= 1
+
+        for max_concurrency, expected in ((8, 4), (2, 2), (1, 1)):
+            runner = TrackingRunner()
+            with (
+                patch("pondera.api.load_case_yaml", return_value=multi_case),
+                patch("pondera.api.get_settings"),
+                patch("pondera.api.apply_prejudge_checks", return_value=[]),
+                patch("pondera.api.choose_rubric", return_value=None),
+                patch("pondera.api.compute_pass", return_value=True),
+            ):
+                result = await evaluate_case_async(
+                    "/fake/path.yaml",
+                    runner=runner,
+                    judge=MockJudge(),
+                    max_concurrency=max_concurrency,
+                )
+            assert len(result.evaluations) == 4
+            assert runner.call_count == 4
+            assert runner.max_active == expected
+
+    @pytest.mark.asyncio
+    async def test_failed_repetition_cancels_the_others(self, sample_case: CaseSpec) -> None:
+        multi_case = CaseSpec(
+            id=sample_case.id,
+            input=sample_case.input,
+            judge=sample_case.judge,
+            repetitions=3,
+        )
+        finished: list[int] = []
+
+        class FailFirstJudge:
+            def __init__(self) -> None:
+                self.calls = 0
+
+            async def judge(self, **kwargs: Any) -> Judgment:
+                self.calls += 1
+                if self.calls == 1:
+                    raise JudgeError("boom")
+                await asyncio.sleep(5)
+                finished.append(self.calls)
+                raise AssertionError("sibling repetition was not cancelled")
+
+        with (
+            patch("pondera.api.load_case_yaml", return_value=multi_case),
+            patch("pondera.api.get_settings"),
+            patch("pondera.api.apply_prejudge_checks", return_value=[]),
+            patch("pondera.api.choose_rubric", return_value=None),
+        ):
+            with pytest.raises(JudgeError, match="boom"):
+                await asyncio.wait_for(
+                    evaluate_case_async(
+                        "/fake/path.yaml", runner=MockRunner(), judge=FailFirstJudge()
+                    ),
+                    timeout=2,
+                )
+        assert finished == []
+
+
+class TestEvaluateCasesAsync:
+    """Test the evaluate_cases_async batch function."""
+
+    @pytest.mark.asyncio
+    async def test_evaluate_cases_async_preserves_order(self, sample_case: CaseSpec) -> None:
+        delays = {"slow": 0.1, "fast": 0.0, "medium": 0.05}
+        cases = {
+            f"/fake/{name}.yaml": CaseSpec(
+                id=name, input=CaseInput(query=name), judge=sample_case.judge
+            )
+            for name in delays
+        }
+        finished: list[str] = []
+
+        class DelayRunner(MockRunner):
+            async def run(self, *, question: str, **kwargs: Any) -> RunResult:
+                self.call_count += 1
+                await asyncio.sleep(delays[question])
+                finished.append(question)
+                return RunResult(question=question, answer="Test answer")
+
+        runner = DelayRunner()
+        judge = MockJudge()
+        with (
+            patch("pondera.api.load_case_yaml", side_effect=lambda p: cases[str(p)]),
+            patch("pondera.api.get_settings"),
+            patch("pondera.api.apply_prejudge_checks", return_value=[]),
+            patch("pondera.api.choose_rubric", return_value=None),
+            patch("pondera.api.compute_pass", return_value=True),
+        ):
+            results = await evaluate_cases_async(tuple(cases), runner=runner, judge=judge)
+        assert [r.case_id for r in results] == ["slow", "fast", "medium"]
+        assert finished == ["fast", "medium", "slow"]
+        assert runner.call_count == 3
+        assert judge.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_evaluate_cases_async_separate_repetition_limit(self) -> None:
+        """The batch limit bounds cases; repetitions keep their own (default 8) limit."""
+        paths = ["/fake/a.yaml", "/fake/b.yaml"]
+        with patch("pondera.api.evaluate_case_async", new_callable=AsyncMock) as per_case:
+            await evaluate_cases_async(paths, runner=MockRunner(), judge=MockJudge())
+            assert {c.kwargs["max_concurrency"] for c in per_case.call_args_list} == {8}
+
+            per_case.reset_mock()
+            await evaluate_cases_async(
+                paths,
+                runner=MockRunner(),
+                judge=MockJudge(),
+                max_concurrency=1,
+                max_repetition_concurrency=3,
+            )
+            assert {c.kwargs["max_concurrency"] for c in per_case.call_args_list} == {3}
+
+    @pytest.mark.asyncio
+    async def test_evaluate_cases_async_empty(self) -> None:
+        assert await evaluate_cases_async([], runner=MockRunner(), judge=MockJudge()) == []
+
+
+class TestAggregateMultiEvaluations:
+    """Test the _aggregate_multi_evaluations helper."""
+
+    def _ev(
+        self, case: CaseSpec, score: int, criteria: dict[str, int], failures: list[str]
+    ) -> EvaluationResult:
+        return EvaluationResult(
+            case_id=case.id,
+            case=case,
+            run=RunResult(question="q", answer="a"),
+            judgment=Judgment(
+                score=score, evaluation_passed=True, reasoning="ok", criteria_scores=criteria
+            ),
+            precheck_failures=failures,
+            overall_threshold=50,
+            passed=True,
+        )
+
+    def test_missing_criteria_count_as_zero(self, sample_case: CaseSpec) -> None:
+        evaluations = [
+            self._ev(sample_case, 80, {"accuracy": 90}, []),
+            self._ev(sample_case, 60, {"accuracy": 70, "clarity": 60}, []),
+            self._ev(sample_case, 70, {"clarity": 30}, ["must_contain failed: 'x'"]),
+        ]
+        aggregates, passed = _aggregate_multi_evaluations(evaluations, AggregationMetric.mean)
+        assert aggregates.overall.mean == pytest.approx(70.0)
+        assert list(aggregates.per_criterion) == ["accuracy", "clarity"]
+        assert aggregates.per_criterion["accuracy"].min == 0.0
+        assert aggregates.per_criterion["accuracy"].mean == pytest.approx(160 / 3)
+        assert aggregates.per_criterion["clarity"].min == 0.0
+        assert aggregates.per_criterion["clarity"].mean == pytest.approx(30.0)
+        assert passed is False
+
 
 class TestEvaluateCase:
     """Test the synchronous evaluate_case function."""
@@ -443,6 +727,40 @@ class TestEvaluateCase:
             ):
                 await evaluate_case_async("/fake/path.yaml", runner=runner, judge=judge)
 
+    @pytest.mark.asyncio
+    async def test_evaluate_case_async_invalid_threshold_keys_low_score(
+        self, sample_case: CaseSpec, sample_rubric: list[RubricCriterion]
+    ) -> None:
+        """A missing threshold key still fails fast when the overall score already fails."""
+        bad_case = CaseSpec(
+            id="test-case",
+            input=sample_case.input,
+            judge=CaseJudge(
+                request="Judge",
+                rubric=sample_rubric,
+                overall_threshold=90,
+                per_criterion_thresholds={"nonexistent": 10},
+            ),
+        )
+        judge = MockJudge(
+            judgment=Judgment(
+                score=40,
+                evaluation_passed=False,
+                reasoning="weak",
+                criteria_scores={"accuracy": 40, "clarity": 40},
+            )
+        )
+        with (
+            patch("pondera.api.load_case_yaml", return_value=bad_case),
+            patch("pondera.api.get_settings"),
+            patch("pondera.api.apply_prejudge_checks", return_value=[]),
+            patch("pondera.api.choose_rubric", return_value=sample_rubric),
+        ):
+            with pytest.raises(
+                pydantic.ValidationError, match="Invalid per_criterion_thresholds keys"
+            ):
+                await evaluate_case_async("/fake/path.yaml", runner=MockRunner(), judge=judge)
+
     def test_evaluate_case_default_judge(self, sample_case: CaseSpec) -> None:
         """If no judge passed, built-in Judge should be instantiated and used."""
         runner = MockRunner()
@@ -452,7 +770,7 @@ class TestEvaluateCase:
             patch("pondera.api.apply_prejudge_checks", return_value=[]),
             patch("pondera.api.choose_rubric", return_value=None),
             patch("pondera.api.compute_pass", return_value=True),
-            patch("pondera.api.Judge") as mock_builtin_judge,
+            patch("pondera.judge.base.Judge") as mock_builtin_judge,
         ):
             inst = mock_builtin_judge.return_value
 
@@ -475,6 +793,83 @@ class TestEvaluateCase:
         assert single.judgment.score == 90
         mock_builtin_judge.assert_called_once()
 
+    def test_evaluate_case_reuses_event_loop(self, sample_case: CaseSpec) -> None:
+        """Consecutive sync calls run on the same (persistent) event loop."""
+        loops: list[asyncio.AbstractEventLoop] = []
+
+        class LoopRecordingRunner(MockRunner):
+            async def run(self, **kwargs: Any) -> RunResult:
+                loops.append(asyncio.get_running_loop())
+                return await super().run(**kwargs)
+
+        runner = LoopRecordingRunner()
+        with (
+            patch("pondera.api.load_case_yaml", return_value=sample_case),
+            patch("pondera.api.get_settings"),
+            patch("pondera.api.apply_prejudge_checks", return_value=[]),
+            patch("pondera.api.choose_rubric", return_value=None),
+            patch("pondera.api.compute_pass", return_value=True),
+        ):
+            evaluate_case("/fake/path.yaml", runner=runner, judge=MockJudge())
+            evaluate_case("/fake/path.yaml", runner=runner, judge=MockJudge())
+        assert len(loops) == 2
+        assert loops[0] is loops[1]
+        assert not loops[0].is_closed()
+
+    def test_evaluate_case_drains_loop_after_interrupt(self, sample_case: CaseSpec) -> None:
+        """An interrupt mid-evaluation does not leak pending tasks into the next call."""
+        case = sample_case.model_copy(update={"repetitions": 2})
+
+        class InterruptingRunner(MockRunner):
+            async def run(self, **kwargs: Any) -> RunResult:
+                self.call_count += 1
+                if self.call_count == 1:
+                    await asyncio.sleep(10)
+                await asyncio.sleep(0)
+                raise KeyboardInterrupt
+
+        with (
+            patch("pondera.api.load_case_yaml", return_value=case),
+            patch("pondera.api.get_settings"),
+            patch("pondera.api.apply_prejudge_checks", return_value=[]),
+            patch("pondera.api.choose_rubric", return_value=None),
+            patch("pondera.api.compute_pass", return_value=True),
+        ):
+            with pytest.raises(KeyboardInterrupt):
+                evaluate_case("/fake/path.yaml", runner=InterruptingRunner(), judge=MockJudge())
+            assert not asyncio.all_tasks(_get_persistent_loop())
+            result = evaluate_case("/fake/path.yaml", runner=MockRunner(), judge=MockJudge())
+        assert len(result.evaluations) == 2
+
+    def test_persistent_loop_closed_when_thread_ends(self) -> None:
+        """A worker thread's loop is closed and released once the thread exits."""
+        loops: list[asyncio.AbstractEventLoop] = []
+        threads = [
+            threading.Thread(target=lambda: loops.append(_get_persistent_loop())) for _ in range(3)
+        ]
+        for t in threads:
+            t.start()
+            t.join()
+        gc.collect()
+        assert len(loops) == 3
+        assert all(loop.is_closed() for loop in loops)
+        assert not any(h.loop in loops for h in _HOLDERS)
+
+    def test_persistent_loop_prefers_uvloop(self) -> None:
+        """uvloop's loop is used when the package is importable."""
+        created: list[asyncio.AbstractEventLoop] = []
+
+        def _fake_uvloop_loop() -> asyncio.AbstractEventLoop:
+            created.append(asyncio.new_event_loop())
+            return created[-1]
+
+        fake_uvloop = type(sys)("uvloop")
+        fake_uvloop.new_event_loop = _fake_uvloop_loop  # type: ignore[attr-defined]
+        with patch.dict(sys.modules, {"uvloop": fake_uvloop}):
+            loop = _new_event_loop()
+        assert created == [loop]
+        loop.close()
+
     def test_evaluate_case_detects_running_loop(self, sample_case: CaseSpec) -> None:
         """Test that sync wrapper detects running event loop."""
         runner = MockRunner()
@@ -593,3 +988,20 @@ class TestApiIntegration:
             assert "runner_s" in single.timings_s
             assert "judge_s" in single.timings_s
             assert "total_s" in single.timings_s
+
+
+def test_importing_api_does_not_load_pydantic_ai() -> None:
+    """The built-in judge (and pydantic-ai) and PyYAML are only imported when used."""
+    code = (
+        "import sys, pondera.api, pondera.judge; "
+        "print('pydantic_ai' in sys.modules, 'yaml' in sys.modules)"
+    )
+    src = str(Path(pondera.__file__).parents[1])
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": src},
+    )
+    assert out.stdout.strip() == "False False"
@@ -0,0 +1,75 @@
+"""Tests for pondera.concurrency module."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from pondera.concurrency import RUNNER_KEY, concurrency_slot, judge_key
+from pondera.settings import PonderaSettings
+
+
+async def _max_in_flight(key: str, n: int) -> int:
+    active = 0
+    peak = 0
+
+    async def _one() -> None:
+        nonlocal active, peak
+        async with concurrency_slot(key):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(_one() for _ in range(n)))
+    return peak
+
+
+class TestConcurrencySlot:
+    """Test the concurrency_slot context manager."""
+
+    @pytest.mark.asyncio
+    async def test_unlimited_by_default(self) -> None:
+        with patch("pondera.concurrency.get_settings", return_value=PonderaSettings()):
+            assert await _max_in_flight(RUNNER_KEY, 5) == 5
+
+    @pytest.mark.asyncio
+    async def test_global_limit(self) -> None:
+        settings = PonderaSettings(max_concurrency=2)
+        with patch("pondera.concurrency.get_settings", return_value=settings):
+            assert await _max_in_flight(RUNNER_KEY, 5) == 2
+
+    @pytest.mark.asyncio
+    async def test_per_key_override(self) -> None:
+        settings = PonderaSettings(max_concurrency=2, provider_max_concurrency={"openai": 3})
+        with patch("pondera.concurrency.get_settings", return_value=settings):
+            assert await _max_in_flight("openai", 5) == 3
+            assert await _max_in_flight(RUNNER_KEY, 5) == 2
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_concurrency": 0},
+            {"max_concurrency": -1},
+            {"provider_max_concurrency": {"openai": 0}},
+            {"provider_max_concurrency": {"runner": -2}},
+        ],
+    )
+    def test_rejects_non_positive_limits(self, kwargs: dict[str, object]) -> None:
+        with pytest.raises(ValidationError):
+            PonderaSettings(**kwargs)
+
+
+class TestJudgeKey:
+    """Test the judge_key helper."""
+
+    def test_uses_model_family(self) -> None:
+        settings = PonderaSettings(model_family="openai")
+        with patch("pondera.concurrency.get_settings", return_value=settings):
+            assert judge_key() == "openai"
+
+    def test_falls_back_without_family(self) -> None:
+        settings = PonderaSettings(model_family=None)
+        with patch("pondera.concurrency.get_settings", return_value=settings):
+            assert judge_key() == "judge"
@@ -1,9 +1,12 @@
 """Tests for pondera.utils module."""
 
+import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+import yaml
 
 from pondera.utils import (
     load_case_yaml,
@@ -149,6 +152,58 @@ missing_required_fields: true
             with pytest.raises(Exception):  # Pydantic validation error
                 load_case_yaml(case_file)
 
+    def test_reuses_cached_parse_until_file_changes(self) -> None:
+        """Repeated loads hit the cache; edits to the file invalidate it."""
+        load_case_yaml.cache_clear()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            case_file = Path(tmpdir) / "cached.yaml"
+            case_file.write_text('id: first\ninput:\n  query: "q"\n')
+            first = load_case_yaml(case_file)
+            first.id = "mutated"
+            assert load_case_yaml(case_file).id == "first"
+
+            case_file.write_text('id: second-version\ninput:\n  query: "q"\n')
+            assert load_case_yaml(case_file).id == "second-version"
+
+    def test_cache_keys_on_absolute_path(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The same relative path from different working directories loads different files."""
+        load_case_yaml.cache_clear()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ("aaa", "bbb"):
+                (Path(tmpdir) / name).mkdir()
+                case_file = Path(tmpdir) / name / "case.yaml"
+                case_file.write_text(f'id: {name}\ninput:\n  query: "q"\n')
+                os.utime(case_file, ns=(0, 0))  # same (relative path, mtime, size) in both dirs
+            ids = []
+            for name in ("aaa", "bbb"):
+                monkeypatch.chdir(Path(tmpdir) / name)
+                ids.append(load_case_yaml("case.yaml").id)
+            assert ids == ["aaa", "bbb"]
+
+    def test_load_json_case(self) -> None:
+        """`.json` cases load through pydantic's JSON parser with the same validation."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            case_file = Path(tmpdir) / "case.json"
+            case_file.write_text('{"id": "json-case", "input": {"query": "q"}}')
+            assert load_case_yaml(case_file).id == "json-case"
+
+            bad_file = Path(tmpdir) / "bad.json"
+            bad_file.write_text('{"id": "bad"}')
+            with pytest.raises(ValidationError, match="Invalid CaseSpec"):
+                load_case_yaml(bad_file)
+
+    def test_uses_libyaml_loader_when_available(self) -> None:
+        """The C loader is used when PyYAML was built with libyaml."""
+        load_case_yaml.cache_clear()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            case_file = Path(tmpdir) / "case.yaml"
+            case_file.write_text('id: loader\ninput:\n  query: "q"\n')
+            with patch("yaml.load", wraps=yaml.load) as load:
+                load_case_yaml(case_file)
+
+        expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+        assert load.call_args.kwargs["Loader"] is expected
+
 
 class TestApplyPrejudgeChecks:
     """Test the apply_prejudge_checks function."""